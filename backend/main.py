@@ -27,7 +27,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config.settings import settings
 from backend.routes import tux_router, health_router
 from tux.controller import TuxController
-from tux.driver import TuxDriver
+from tux.driver import TuxDriverInterface, TuxDriver, HidTuxDriver
 from stubs.mock_driver import MockTuxDriver
 
 # ==========================================
@@ -73,6 +73,7 @@ def initialize_tux_controller() -> TuxController:
     logger.info("║              TUX CONTROLLER INITIALIZATION                   ║")
     logger.info("╚══════════════════════════════════════════════════════════════╝")
     
+    driver: TuxDriverInterface
     if settings.is_dev_mode:
         logger.info("🧪 MODE: DEVELOPMENT (Mock Driver)")
         logger.info("   Commands will be simulated, not sent to real hardware.")
@@ -82,11 +83,13 @@ def initialize_tux_controller() -> TuxController:
     else:
         logger.info("🔧 MODE: PRODUCTION (Real Hardware)")
         logger.info(f"   Device path: {settings.tux_device_path}")
+        logger.info(f"   USB backend: {settings.tux_usb_backend}")
         logger.info("   Commands will be sent to TUX Droid via USB.")
         logger.info("")
         logger.info("   If connection fails, run: python -m scripts.diagnose")
         logger.info("")
-        driver = TuxDriver(device_path=settings.tux_device_path)
+        driver_class = HidTuxDriver if settings.tux_usb_backend == "hidapi" else TuxDriver
+        driver = driver_class(device_path=settings.tux_device_path)
     
     tux_controller = TuxController(driver)
     
@@ -116,6 +119,8 @@ def initialize_tux_controller() -> TuxController:
             logger.error("   3. Run diagnostic tool:")
             logger.error("      $ python -m scripts.diagnose")
             logger.error("")
+            if tux_controller.watch_hotplug():
+                logger.info("👀 Will connect automatically when the TUX dongle is plugged in")
     
     logger.info("╔══════════════════════════════════════════════════════════════╗")
     logger.info("║              INITIALIZATION COMPLETE                         ║")
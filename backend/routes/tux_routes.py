@@ -19,6 +19,7 @@ from ..schemas.tux_schemas import (
     SleepRequest, SleepAction,
     SpeakRequest,
     CustomActionRequest,
+    BatchActionRequest,
     TuxResponse,
     ErrorResponse
 )
@@ -408,51 +409,42 @@ async def custom_action(
     
     logger.info(f"Custom action request: {request.action_type} with params {request.params}")
     
-    # Map action_type string to controller method
-    action_map = {
-        "blink_eyes": lambda: controller.blink_eyes(request.params.get("count", 1)),
-        "open_eyes": lambda: controller.open_eyes(),
-        "close_eyes": lambda: controller.close_eyes(),
-        "move_mouth": lambda: controller.move_mouth(request.params.get("count", 1)),
-        "open_mouth": lambda: controller.open_mouth(),
-        "close_mouth": lambda: controller.close_mouth(),
-        "wave_wings": lambda: controller.wave_wings(
-            request.params.get("count", 1),
-            request.params.get("speed", 3)
-        ),
-        "raise_wings": lambda: controller.raise_wings(),
-        "lower_wings": lambda: controller.lower_wings(),
-        "spin_left": lambda: controller.spin_left(
-            request.params.get("angle", 4),
-            request.params.get("speed", 3)
-        ),
-        "spin_right": lambda: controller.spin_right(
-            request.params.get("angle", 4),
-            request.params.get("speed", 3)
-        ),
-        "led_on": lambda: controller.led_on(request.params.get("target", "both")),
-        "led_off": lambda: controller.led_off(request.params.get("target", "both")),
-        "led_toggle": lambda: controller.led_toggle(
-            request.params.get("count", 1),
-            request.params.get("delay", 25)
-        ),
-        "play_sound": lambda: controller.play_sound(
-            request.params.get("sound_number", 0),
-            request.params.get("volume", 100)
-        ),
-        "sleep": lambda: controller.sleep(request.params.get("mode", "normal")),
-        "wake_up": lambda: controller.wake_up(),
-    }
-    
-    action_func = action_map.get(request.action_type)
-    if action_func is None:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unknown action type: {request.action_type}. "
-                   f"Available: {list(action_map.keys())}"
+    try:
+        result = controller.dispatch(request.action_type, request.params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return create_response(result)
+
+
+@router.post(
+    "/batch",
+    response_model=TuxResponse,
+    summary="Batch Actions",
+    description="Execute several TUX actions in order with a single request"
+)
+async def batch_actions(
+    request: BatchActionRequest,
+    controller=Depends(get_tux_controller)
+):
+    """
+    Execute a sequence of TUX Droid actions.
+    
+    Each entry uses the same format as the custom action endpoint.
+    Consecutive repeats of the same movement are merged into one command,
+    and the driver runs the whole sequence as one batch.
+    """
+    ensure_connected(controller)
+    
+    logger.info(f"Batch request: {len(request.actions)} action(s)")
+    
+    try:
+        result = controller.dispatch_many(
+            (item.action_type, item.params) for item in request.actions
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    result = action_func()
     return create_response(result)
 
 
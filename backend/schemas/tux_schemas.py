@@ -231,6 +231,26 @@ class CustomActionRequest(BaseModel):
     }
 
 
+class BatchActionRequest(BaseModel):
+    """Request model for executing several actions in one call."""
+    actions: List[CustomActionRequest] = Field(
+        ..., min_length=1, max_length=100, description="Actions to execute, in order"
+    )
+    
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "actions": [
+                        {"action_type": "blink_eyes", "params": {"count": 2}},
+                        {"action_type": "wave_wings", "params": {"count": 3, "speed": 4}}
+                    ]
+                }
+            ]
+        }
+    }
+
+
 # ==========================================
 # Response Models
 # ==========================================
@@ -3,8 +3,13 @@ TUX Droid AI Control - Telegram Keyboards
 =========================================
 
 Button layouts and keyboard builders for the Telegram bot.
+
+Layouts are static, so each builder is cached and returns the same
+(immutable) markup instance on every call.
 """
 
+from functools import lru_cache
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup
 
 
@@ -81,6 +86,7 @@ class CallbackData:
 # Main Menu Keyboard
 # ==========================================
 
+@lru_cache()
 def get_main_menu_keyboard() -> InlineKeyboardMarkup:
     """
     Get the main menu keyboard.
@@ -113,6 +119,7 @@ def get_main_menu_keyboard() -> InlineKeyboardMarkup:
 # Eyes Menu Keyboard
 # ==========================================
 
+@lru_cache()
 def get_eyes_keyboard() -> InlineKeyboardMarkup:
     """Get the eyes control keyboard."""
     keyboard = [
@@ -136,6 +143,7 @@ def get_eyes_keyboard() -> InlineKeyboardMarkup:
 # Mouth Menu Keyboard
 # ==========================================
 
+@lru_cache()
 def get_mouth_keyboard() -> InlineKeyboardMarkup:
     """Get the mouth control keyboard."""
     keyboard = [
@@ -159,6 +167,7 @@ def get_mouth_keyboard() -> InlineKeyboardMarkup:
 # Wings Menu Keyboard
 # ==========================================
 
+@lru_cache()
 def get_wings_keyboard() -> InlineKeyboardMarkup:
     """Get the wings control keyboard."""
     keyboard = [
@@ -182,6 +191,7 @@ def get_wings_keyboard() -> InlineKeyboardMarkup:
 # Spin Menu Keyboard
 # ==========================================
 
+@lru_cache()
 def get_spin_keyboard() -> InlineKeyboardMarkup:
     """Get the spin control keyboard."""
     keyboard = [
@@ -208,6 +218,7 @@ def get_spin_keyboard() -> InlineKeyboardMarkup:
 # LEDs Menu Keyboard
 # ==========================================
 
+@lru_cache()
 def get_leds_keyboard() -> InlineKeyboardMarkup:
     """Get the LED control keyboard."""
     keyboard = [
@@ -234,6 +245,7 @@ def get_leds_keyboard() -> InlineKeyboardMarkup:
 # Sound Menu Keyboard
 # ==========================================
 
+@lru_cache()
 def get_sound_keyboard() -> InlineKeyboardMarkup:
     """Get the sound control keyboard."""
     keyboard = [
@@ -257,6 +269,7 @@ def get_sound_keyboard() -> InlineKeyboardMarkup:
 # Sleep Menu Keyboard
 # ==========================================
 
+@lru_cache()
 def get_sleep_keyboard() -> InlineKeyboardMarkup:
     """Get the sleep control keyboard."""
     keyboard = [
@@ -281,6 +294,7 @@ def get_sleep_keyboard() -> InlineKeyboardMarkup:
 # Back Button Only
 # ==========================================
 
+@lru_cache()
 def get_back_keyboard() -> InlineKeyboardMarkup:
     """Get a keyboard with only the back button."""
     keyboard = [
@@ -293,6 +307,7 @@ def get_back_keyboard() -> InlineKeyboardMarkup:
 # Quick Action Reply Keyboard
 # ==========================================
 
+@lru_cache()
 def get_quick_actions_keyboard() -> ReplyKeyboardMarkup:
     """
     Get a reply keyboard for quick actions.
@@ -33,6 +33,7 @@ class Settings(BaseSettings):
     # TUX Droid Settings
     tux_mode: Literal["DEV", "PROD"] = "DEV"
     tux_device_path: str = "/dev/ttyUSB0"
+    tux_usb_backend: Literal["pyusb", "hidapi"] = "pyusb"
     
     # Logging Settings
     log_level: str = "INFO"
@@ -0,0 +1,11 @@
+"""
+TUX Droid AI Control - Root pytest configuration
+================================================
+
+Makes the project packages importable for the whole test session.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
@@ -14,7 +14,6 @@ Usage:
 
 import sys
 import os
-import glob
 import logging
 
 # Add parent directory to path
@@ -65,20 +64,32 @@ def check_python_packages():
     return results
 
 
+def list_dir(path):
+    """Return the full paths of the entries in a directory (empty if missing)."""
+    try:
+        with os.scandir(path) as entries:
+            return sorted(entry.path for entry in entries)
+    except OSError:
+        return []
+
+
 def check_serial_devices():
     """Check available serial devices."""
     print_header("SERIAL DEVICES CHECK")
     
+    # One pass over /dev instead of a glob per pattern
+    dev_entries = list_dir("/dev")
     patterns = [
-        ("/dev/ttyUSB*", "USB Serial"),
-        ("/dev/ttyACM*", "ACM Serial"),
-        ("/dev/serial/by-id/*", "Serial by ID"),
+        ("/dev/ttyUSB*", "USB Serial",
+         [d for d in dev_entries if d.startswith("/dev/ttyUSB")]),
+        ("/dev/ttyACM*", "ACM Serial",
+         [d for d in dev_entries if d.startswith("/dev/ttyACM")]),
+        ("/dev/serial/by-id/*", "Serial by ID", list_dir("/dev/serial/by-id")),
     ]
     
     found_devices = []
     
-    for pattern, description in patterns:
-        devices = glob.glob(pattern)
+    for pattern, description, devices in patterns:
         print_section(f"{description} ({pattern})")
         if devices:
             for dev in devices:
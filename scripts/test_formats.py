@@ -38,6 +38,9 @@ LED_OFF_CMD = 0x1B
 LED_TOGGLE_CMD = 0x9A
 PING_CMD = 0x7F
 
+# Zero padding, allocated once and sliced per packet
+ZERO_PAD = bytes(64)
+
 
 def find_tux():
     """Find TUX Droid USB device."""
@@ -137,7 +140,7 @@ def main():
     # FORMAT 2: 4 bytes padded to 64 bytes
     # ============================================================
     cmd = bytes([BLINK_EYES_CMD, 0x03, 0x00, 0x00])  # Blink 3 times
-    padded = cmd + bytes(60)  # Pad to 64 bytes
+    padded = cmd + ZERO_PAD[:60]  # Pad to 64 bytes
     test_format(dev, "Format 2: 4 bytes padded to 64 bytes (Blink x3)", padded)
     
     time.sleep(2)
@@ -154,7 +157,7 @@ def main():
     # FORMAT 4: HID Report ID 0 + 4 bytes + padding to 64
     # ============================================================
     cmd = bytes([0x00, BLINK_EYES_CMD, 0x05, 0x00, 0x00])
-    padded = cmd + bytes(59)
+    padded = cmd + ZERO_PAD[:59]
     test_format(dev, "Format 4: Report ID 0 + 4 bytes + padding", padded)
     
     time.sleep(2)
@@ -172,7 +175,7 @@ def main():
     # FORMAT 6: 2-byte header + command + padding to 64
     # ============================================================
     cmd = bytes([0x00, 0x00, BLINK_EYES_CMD, 0x03, 0x00, 0x00])
-    padded = cmd + bytes(58)
+    padded = cmd + ZERO_PAD[:58]
     test_format(dev, "Format 6: 2-byte header + command + padding", padded)
     
     time.sleep(2)
@@ -186,7 +189,7 @@ def main():
     time.sleep(1)
     
     test_format(dev, "Format 7b: PING (64 bytes)", 
-                bytes([PING_CMD, 0x01, 0x00, 0x00]) + bytes(60))
+                bytes([PING_CMD, 0x01, 0x00, 0x00]) + ZERO_PAD[:60])
     
     time.sleep(1)
     
@@ -208,7 +211,7 @@ def main():
     # ============================================================
     # FORMAT 9: Full SPI frame padded to 64
     # ============================================================
-    padded = bytes(spi_frame) + bytes(25)
+    padded = bytes(spi_frame) + ZERO_PAD[:25]
     test_format(dev, "Format 9: SPI frame padded to 64", padded)
     
     time.sleep(2)
@@ -219,13 +222,13 @@ def main():
     for size in [4, 8, 16, 32, 64]:
         cmd = bytes([LED_ON_CMD, 0x00, 0x00, 0x00])
         if size > 4:
-            cmd = cmd + bytes(size - 4)
+            cmd = cmd + ZERO_PAD[:size - 4]
         test_format(dev, f"Format 10: LED_ON with {size} bytes", cmd)
         time.sleep(0.5)
         
         cmd = bytes([LED_OFF_CMD, 0x00, 0x00, 0x00])
         if size > 4:
-            cmd = cmd + bytes(size - 4)
+            cmd = cmd + ZERO_PAD[:size - 4]
         test_format(dev, f"Format 10: LED_OFF with {size} bytes", cmd)
         time.sleep(0.5)
     
@@ -7,20 +7,54 @@ actual TUX Droid hardware connected.
 """
 
 import logging
-import time
-from typing import Dict, Any, List
-from datetime import datetime
-
-# Import from parent package
 import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import time
+from types import MappingProxyType
+from collections import deque
+from typing import Dict, Any, Deque, Iterable, List, Mapping, Tuple
 
 from tux.driver import TuxDriverInterface
 from tux.actions import TuxAction, ActionType, FIRMWARE_COMMANDS
 
 logger = logging.getLogger(__name__)
 
+# Packed simulated state layout: key -> (bit shift, mask, values by code).
+# Categorical fields store the index of their value; values=None stores
+# the raw integer. Code 0 of every field is the default state.
+_STATE_FIELDS = {
+    "eyes": (0, 0b1, ("open", "closed")),
+    "mouth": (1, 0b1, ("closed", "open")),
+    "wings": (2, 0b1, ("lowered", "raised")),
+    "leds_left": (3, 0b1, ("off", "on")),
+    "leds_right": (4, 0b1, ("off", "on")),
+    "sleeping": (5, 0b1, (False, True)),
+    "rotation": (6, 0xFFFF, None),
+}
+
+
+def _encode_field(key: str, value: Any) -> Tuple[int, int]:
+    """Return (field mask, field bits) for a state value."""
+    shift, mask, values = _STATE_FIELDS[key]
+    code = value if values is None else values.index(value)
+    return mask << shift, (code & mask) << shift
+
+
+def _unpack_state(bits: int) -> Dict[str, Any]:
+    """Expand packed state bits into the public state dict."""
+    state = {}
+    for key, (shift, mask, values) in _STATE_FIELDS.items():
+        code = (bits >> shift) & mask
+        state[key] = code if values is None else values[code]
+    return state
+
+
+# Default simulated state (all fields at code 0)
+_DEFAULT_STATE_BITS = 0
+
+# LED targets that affect each side
+_LEFT_TARGETS = frozenset(("both", "left"))
+_RIGHT_TARGETS = frozenset(("both", "right"))
+
 
 class MockTuxDriver(TuxDriverInterface):
     """
@@ -39,31 +73,53 @@ class MockTuxDriver(TuxDriverInterface):
         print(driver.get_action_history())
     """
     
-    def __init__(self, simulate_delay: bool = True, delay_ms: int = 100):
+    __slots__ = (
+        "_connected",
+        "_simulate_delay",
+        "_delay_s",
+        "_verbose",
+        "_state_bits",
+        "_state_version",
+        "_snapshot_version",
+        "_snapshot",
+        "_action_history",
+        "_pending_log",
+        "_actions_logged",
+    )
+    
+    # Number of buffered log entries before they are moved into history
+    _LOG_FLUSH_THRESHOLD = 64
+    
+    # Sleep hook used for simulated delays (tests replace it with a no-op)
+    _sleep = staticmethod(time.sleep)
+    
+    def __init__(self, simulate_delay: bool = True, delay_ms: int = 100,
+                 history_max: int = 10_000, verbose: bool = True):
         """
         Initialize the mock driver.
         
         Args:
             simulate_delay: Whether to add realistic delays
             delay_ms: Simulated delay in milliseconds
+            history_max: Maximum number of action records to keep
+            verbose: Whether to print visual feedback for each action
         """
         self._connected = False
         self._simulate_delay = simulate_delay
-        self._delay_ms = delay_ms
+        self._delay_s = delay_ms / 1000.0
+        self._verbose = verbose
         
         # Track simulated state
-        self._state = {
-            "eyes": "open",
-            "mouth": "closed",
-            "wings": "lowered",
-            "leds_left": "off",
-            "leds_right": "off",
-            "sleeping": False,
-            "rotation": 0,
-        }
+        self._state_bits = _DEFAULT_STATE_BITS
+        self._state_version = 0
+        self._snapshot_version = -1
+        self._snapshot: Mapping[str, Any] = MappingProxyType({})
         
         # Action history for debugging
-        self._action_history: List[Dict[str, Any]] = []
+        self._action_history: Deque[Dict[str, Any]] = deque(maxlen=history_max)
+        self._pending_log: List[Tuple[int, str, Dict[str, Any], str, Mapping[str, Any]]] = []
+        # History drops old records past history_max; this keeps the full count
+        self._actions_logged = 0
         
         logger.info("MockTuxDriver initialized (simulation mode)")
     
@@ -95,7 +151,8 @@ class MockTuxDriver(TuxDriverInterface):
             return False
         
         self._simulate_action_delay()
-        logger.debug(f"🐧 [MOCK] Sent raw command: {command.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🐧 [MOCK] Sent raw command: %s", command.hex())
         return True
     
     def execute_action(self, action: TuxAction) -> bool:
@@ -115,183 +172,249 @@ class MockTuxDriver(TuxDriverInterface):
         params = action.params
         
         # Update simulated state based on action
-        state_message = self._update_state(action_type, params)
+        self._update_state(action_type, params)
         
-        # Log the action
-        self._log_action(action_type.value, params, state_message)
+        # One template lookup feeds the history, visual feedback and log line
+        state_message, visual = self._describe_action(action_type, params)
+        self._log_action(action.type_value, params, state_message)
         
-        # Print visual feedback
-        self._print_visual_feedback(action_type, params)
+        if self._verbose:
+            sys.stdout.write(visual)
         
-        logger.info(f"🐧 [MOCK] Executed: {action_type.value} | {state_message}")
+        logger.info("🐧 [MOCK] Executed: %s | %s", action.type_value, state_message)
         return True
     
-    def _update_state(self, action_type: ActionType, params: Dict[str, Any]) -> str:
-        """Update simulated TUX state based on action."""
-        
-        # Eye actions
-        if action_type == ActionType.BLINK_EYES:
-            count = params.get("count", 1)
-            return f"Eyes blinked {count} time(s)"
-        elif action_type == ActionType.OPEN_EYES:
-            self._state["eyes"] = "open"
-            return "Eyes are now open"
-        elif action_type == ActionType.CLOSE_EYES:
-            self._state["eyes"] = "closed"
-            return "Eyes are now closed"
-        elif action_type == ActionType.STOP_EYES:
-            return "Eye movement stopped"
-        
-        # Mouth actions
-        elif action_type == ActionType.MOVE_MOUTH:
-            count = params.get("count", 1)
-            return f"Mouth moved {count} time(s)"
-        elif action_type == ActionType.OPEN_MOUTH:
-            self._state["mouth"] = "open"
-            return "Mouth is now open"
-        elif action_type == ActionType.CLOSE_MOUTH:
-            self._state["mouth"] = "closed"
-            return "Mouth is now closed"
-        elif action_type == ActionType.STOP_MOUTH:
-            return "Mouth movement stopped"
-        
-        # Wing actions
-        elif action_type == ActionType.WAVE_WINGS:
-            count = params.get("count", 1)
-            speed = params.get("speed", 3)
-            return f"Wings waved {count} time(s) at speed {speed}"
-        elif action_type == ActionType.RAISE_WINGS:
-            self._state["wings"] = "raised"
-            return "Wings are now raised"
-        elif action_type == ActionType.LOWER_WINGS:
-            self._state["wings"] = "lowered"
-            return "Wings are now lowered"
-        elif action_type == ActionType.STOP_WINGS:
-            return "Wing movement stopped"
-        elif action_type == ActionType.RESET_WINGS:
-            self._state["wings"] = "lowered"
-            return "Wings reset to default position"
-        
-        # Spin actions
-        elif action_type == ActionType.SPIN_LEFT:
-            angle = params.get("angle", 4)
-            speed = params.get("speed", 3)
-            self._state["rotation"] = (self._state["rotation"] - angle * 45) % 360
-            return f"Spun left {angle} units at speed {speed}"
-        elif action_type == ActionType.SPIN_RIGHT:
-            angle = params.get("angle", 4)
-            speed = params.get("speed", 3)
-            self._state["rotation"] = (self._state["rotation"] + angle * 45) % 360
-            return f"Spun right {angle} units at speed {speed}"
-        elif action_type == ActionType.STOP_SPIN:
-            return "Spinning stopped"
-        
-        # LED actions
-        elif action_type == ActionType.LED_ON:
-            target = params.get("target", "both")
-            if target in ["both", "left"]:
-                self._state["leds_left"] = "on"
-            if target in ["both", "right"]:
-                self._state["leds_right"] = "on"
-            return f"LED(s) {target} turned on"
-        elif action_type == ActionType.LED_OFF:
-            target = params.get("target", "both")
-            if target in ["both", "left"]:
-                self._state["leds_left"] = "off"
-            if target in ["both", "right"]:
-                self._state["leds_right"] = "off"
-            return f"LED(s) {target} turned off"
-        elif action_type == ActionType.LED_TOGGLE:
-            count = params.get("count", 1)
-            return f"LEDs toggled {count} time(s)"
-        elif action_type == ActionType.LED_PULSE:
-            count = params.get("count", 5)
-            return f"LEDs pulsed {count} time(s)"
+    def batch_execute(self, actions: Iterable[TuxAction]) -> bool:
+        """
+        Simulate executing a sequence of TUX actions.
         
-        # Sound actions
-        elif action_type == ActionType.PLAY_SOUND:
-            sound_num = params.get("sound_number", 0)
-            volume = params.get("volume", 100)
-            return f"Playing sound #{sound_num} at volume {volume}"
-        elif action_type == ActionType.MUTE:
-            return "Audio muted"
-        elif action_type == ActionType.UNMUTE:
-            return "Audio unmuted"
+        State updates and history records are applied per action, but the
+        simulated delay and the summary log line happen once per batch.
+        """
+        if not self._connected:
+            logger.warning("🐧 [MOCK] Cannot execute batch: Not connected")
+            return False
         
-        # Sleep actions
-        elif action_type == ActionType.SLEEP:
-            mode = params.get("mode", "normal")
-            self._state["sleeping"] = True
-            return f"TUX is now sleeping (mode: {mode})"
-        elif action_type == ActionType.WAKE_UP:
-            self._state["sleeping"] = False
-            return "TUX is now awake"
+        count = 0
+        for action in actions:
+            action_type = action.action_type
+            params = action.params
+            self._update_state(action_type, params)
+            state_message, visual = self._describe_action(action_type, params)
+            self._log_action(action.type_value, params, state_message)
+            if self._verbose:
+                sys.stdout.write(visual)
+            count += 1
         
-        return f"Action {action_type.value} executed"
+        self._simulate_action_delay()
+        logger.info("🐧 [MOCK] Executed batch of %d action(s)", count)
+        return True
     
-    def _print_visual_feedback(self, action_type: ActionType, params: Dict[str, Any]):
-        """Print ASCII art feedback for actions."""
+    def _update_state(self, action_type: ActionType, params: Mapping[str, Any]):
+        """Update simulated TUX state based on action."""
+        mutation = self._STATE_MUTATIONS.get(action_type)
+        if mutation is not None:
+            self._write_bits(*mutation)
         
-        visuals = {
-            ActionType.BLINK_EYES: "👀 *blink blink*",
-            ActionType.OPEN_EYES: "👁️👁️ Eyes wide open!",
-            ActionType.CLOSE_EYES: "😌 Eyes closed...",
-            ActionType.OPEN_MOUTH: "😮 Mouth open!",
-            ActionType.CLOSE_MOUTH: "😶 Mouth closed",
-            ActionType.MOVE_MOUTH: "🗣️ *chomp chomp*",
-            ActionType.WAVE_WINGS: "🐧 *flap flap flap*",
-            ActionType.RAISE_WINGS: "🙌 Wings up!",
-            ActionType.LOWER_WINGS: "🐧 Wings down",
-            ActionType.SPIN_LEFT: "↩️ Spinning left...",
-            ActionType.SPIN_RIGHT: "↪️ Spinning right...",
-            ActionType.LED_ON: "💡 LEDs ON",
-            ActionType.LED_OFF: "🔌 LEDs OFF",
-            ActionType.LED_TOGGLE: "✨ *blink blink*",
-            ActionType.LED_PULSE: "🌟 *pulse pulse*",
-            ActionType.PLAY_SOUND: "🔊 Playing sound...",
-            ActionType.SLEEP: "😴 Zzz...",
-            ActionType.WAKE_UP: "⏰ Good morning!",
-        }
+        handler = self._STATE_HANDLERS.get(action_type)
+        if handler is not None:
+            handler(self, params)
+    
+    def _describe_action(self, action_type: ActionType,
+                         params: Mapping[str, Any]) -> Tuple[str, str]:
+        """
+        Render the result message and visual feedback line for an action.
         
-        visual = visuals.get(action_type, "🐧 TUX is doing something!")
-        print(f"\n    {visual}\n")
-    
-    def _log_action(self, action: str, params: Dict[str, Any], message: str):
-        """Log an action to history."""
-        self._action_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "params": params,
-            "message": message,
-            "state_snapshot": self._state.copy()
-        })
+        Returns:
+            tuple: (state message, pre-formatted visual feedback line)
+        """
+        template = self._ACTION_TEMPLATES.get(action_type)
+        if template is None:
+            return f"Action {action_type.value} executed", self._DEFAULT_VISUAL
+        message, defaults, visual = template
+        return message.format_map({**defaults, **params}), visual
+    
+    def _write_bits(self, field_mask: int, field_bits: int):
+        """Write packed field bits, bumping the state version if they changed."""
+        bits = (self._state_bits & ~field_mask) | field_bits
+        if bits != self._state_bits:
+            self._state_bits = bits
+            self._state_version += 1
+    
+    def _set_state(self, key: str, value: Any):
+        """Write a single state value."""
+        self._write_bits(*_encode_field(key, value))
+    
+    def _get_state(self, key: str) -> Any:
+        """Read a single state value."""
+        shift, mask, values = _STATE_FIELDS[key]
+        code = (self._state_bits >> shift) & mask
+        return code if values is None else values[code]
+    
+    # ==========================================
+    # State Tables
+    # ==========================================
+    
+    # Fixed state writes, pre-encoded as (field mask, field bits)
+    _STATE_MUTATIONS = {
+        ActionType.OPEN_EYES: _encode_field("eyes", "open"),
+        ActionType.CLOSE_EYES: _encode_field("eyes", "closed"),
+        ActionType.OPEN_MOUTH: _encode_field("mouth", "open"),
+        ActionType.CLOSE_MOUTH: _encode_field("mouth", "closed"),
+        ActionType.RAISE_WINGS: _encode_field("wings", "raised"),
+        ActionType.LOWER_WINGS: _encode_field("wings", "lowered"),
+        ActionType.RESET_WINGS: _encode_field("wings", "lowered"),
+        ActionType.SLEEP: _encode_field("sleeping", True),
+        ActionType.WAKE_UP: _encode_field("sleeping", False),
+    }
+    
+    # ==========================================
+    # State Handlers (parameter-dependent writes)
+    # ==========================================
+    
+    def _on_spin_left(self, params: Mapping[str, Any]):
+        angle = params.get("angle", 4)
+        self._set_state("rotation", (self._get_state("rotation") - angle * 45) % 360)
+    
+    def _on_spin_right(self, params: Mapping[str, Any]):
+        angle = params.get("angle", 4)
+        self._set_state("rotation", (self._get_state("rotation") + angle * 45) % 360)
+    
+    def _on_led_on(self, params: Mapping[str, Any]):
+        target = params.get("target", "both")
+        if target in _LEFT_TARGETS:
+            self._set_state("leds_left", "on")
+        if target in _RIGHT_TARGETS:
+            self._set_state("leds_right", "on")
+    
+    def _on_led_off(self, params: Mapping[str, Any]):
+        target = params.get("target", "both")
+        if target in _LEFT_TARGETS:
+            self._set_state("leds_left", "off")
+        if target in _RIGHT_TARGETS:
+            self._set_state("leds_right", "off")
+    
+    _STATE_HANDLERS = {
+        ActionType.SPIN_LEFT: _on_spin_left,
+        ActionType.SPIN_RIGHT: _on_spin_right,
+        ActionType.LED_ON: _on_led_on,
+        ActionType.LED_OFF: _on_led_off,
+    }
+    
+    # Per-action (message template, parameter defaults, visual feedback line).
+    # Visual lines are pre-formatted exactly as they are written to stdout.
+    _DEFAULT_VISUAL = "\n    🐧 TUX is doing something!\n\n"
+    _ACTION_TEMPLATES: Dict[ActionType, Tuple[str, Dict[str, Any], str]] = {
+        ActionType.BLINK_EYES: ("Eyes blinked {count} time(s)", {"count": 1}, "\n    👀 *blink blink*\n\n"),
+        ActionType.OPEN_EYES: ("Eyes are now open", {}, "\n    👁️👁️ Eyes wide open!\n\n"),
+        ActionType.CLOSE_EYES: ("Eyes are now closed", {}, "\n    😌 Eyes closed...\n\n"),
+        ActionType.STOP_EYES: ("Eye movement stopped", {}, _DEFAULT_VISUAL),
+        ActionType.MOVE_MOUTH: ("Mouth moved {count} time(s)", {"count": 1}, "\n    🗣️ *chomp chomp*\n\n"),
+        ActionType.OPEN_MOUTH: ("Mouth is now open", {}, "\n    😮 Mouth open!\n\n"),
+        ActionType.CLOSE_MOUTH: ("Mouth is now closed", {}, "\n    😶 Mouth closed\n\n"),
+        ActionType.STOP_MOUTH: ("Mouth movement stopped", {}, _DEFAULT_VISUAL),
+        ActionType.WAVE_WINGS: ("Wings waved {count} time(s) at speed {speed}", {"count": 1, "speed": 3}, "\n    🐧 *flap flap flap*\n\n"),
+        ActionType.RAISE_WINGS: ("Wings are now raised", {}, "\n    🙌 Wings up!\n\n"),
+        ActionType.LOWER_WINGS: ("Wings are now lowered", {}, "\n    🐧 Wings down\n\n"),
+        ActionType.STOP_WINGS: ("Wing movement stopped", {}, _DEFAULT_VISUAL),
+        ActionType.RESET_WINGS: ("Wings reset to default position", {}, _DEFAULT_VISUAL),
+        ActionType.SPIN_LEFT: ("Spun left {angle} units at speed {speed}", {"angle": 4, "speed": 3}, "\n    ↩️ Spinning left...\n\n"),
+        ActionType.SPIN_RIGHT: ("Spun right {angle} units at speed {speed}", {"angle": 4, "speed": 3}, "\n    ↪️ Spinning right...\n\n"),
+        ActionType.STOP_SPIN: ("Spinning stopped", {}, _DEFAULT_VISUAL),
+        ActionType.LED_ON: ("LED(s) {target} turned on", {"target": "both"}, "\n    💡 LEDs ON\n\n"),
+        ActionType.LED_OFF: ("LED(s) {target} turned off", {"target": "both"}, "\n    🔌 LEDs OFF\n\n"),
+        ActionType.LED_TOGGLE: ("LEDs toggled {count} time(s)", {"count": 1}, "\n    ✨ *blink blink*\n\n"),
+        ActionType.LED_PULSE: ("LEDs pulsed {count} time(s)", {"count": 5}, "\n    🌟 *pulse pulse*\n\n"),
+        ActionType.PLAY_SOUND: ("Playing sound #{sound_number} at volume {volume}", {"sound_number": 0, "volume": 100}, "\n    🔊 Playing sound...\n\n"),
+        ActionType.MUTE: ("Audio muted", {}, _DEFAULT_VISUAL),
+        ActionType.UNMUTE: ("Audio unmuted", {}, _DEFAULT_VISUAL),
+        ActionType.SLEEP: ("TUX is now sleeping (mode: {mode})", {"mode": "normal"}, "\n    😴 Zzz...\n\n"),
+        ActionType.WAKE_UP: ("TUX is now awake", {}, "\n    ⏰ Good morning!\n\n"),
+    }
+    
+    def _log_action(self, action: str, params: Mapping[str, Any], message: str):
+        """Log an action to history (buffered until read or threshold)."""
+        self._actions_logged += 1
+        # Copy params so later changes to the action do not rewrite history
+        self._pending_log.append(
+            (time.time_ns(), action, dict(params), message, self._state_snapshot())
+        )
+        if len(self._pending_log) >= self._LOG_FLUSH_THRESHOLD:
+            self._flush_log()
+    
+    def _flush_log(self):
+        """Promote buffered log entries into the action history."""
+        if not self._pending_log:
+            return
+        self._action_history.extend(
+            {
+                "timestamp_ns": timestamp_ns,
+                "action": action,
+                "params": params,
+                "message": message,
+                "state_snapshot": snapshot,
+            }
+            for timestamp_ns, action, params, message, snapshot in self._pending_log
+        )
+        self._pending_log.clear()
+    
+    def _state_snapshot(self) -> Mapping[str, Any]:
+        """Return a read-only state snapshot, reused until the state changes."""
+        if self._snapshot_version != self._state_version:
+            self._snapshot = MappingProxyType(_unpack_state(self._state_bits))
+            self._snapshot_version = self._state_version
+        return self._snapshot
     
     def _simulate_action_delay(self):
         """Add simulated delay for realism."""
-        if self._simulate_delay:
-            time.sleep(self._delay_ms / 1000.0)
+        if self._simulate_delay and self._delay_s:
+            self._sleep(self._delay_s)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current virtual TUX status."""
         return {
             "connected": self._connected,
             "driver_type": "mock",
-            "simulated_state": self._state.copy(),
-            "actions_executed": len(self._action_history)
+            "simulated_state": dict(self._state_snapshot()),
+            "actions_executed": self._actions_logged
         }
     
-    def get_action_history(self) -> List[Dict[str, Any]]:
+    def get_action_history(self, iso: bool = True) -> List[Dict[str, Any]]:
         """
-        Get the history of all executed actions.
+        Get the history of executed actions (most recent history_max).
+        
+        Timestamps are recorded as raw nanoseconds and only formatted here.
+        State snapshots are shared between records while the state is
+        unchanged, so each returned record gets its own dict copy.
+        
+        Args:
+            iso: Add an ISO-8601 "timestamp" string to each record
         
         Returns:
             list: List of action records with timestamps
         """
-        return self._action_history.copy()
+        self._flush_log()
+        if not iso:
+            return [
+                {**record, "state_snapshot": dict(record["state_snapshot"])}
+                for record in self._action_history
+            ]
+        
+        from datetime import datetime
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(record["timestamp_ns"] / 1e9).isoformat(),
+                **record,
+                "state_snapshot": dict(record["state_snapshot"]),
+            }
+            for record in self._action_history
+        ]
     
     def clear_history(self):
         """Clear the action history."""
+        self._pending_log.clear()
         self._action_history.clear()
+        self._actions_logged = 0
         logger.info("🐧 [MOCK] Action history cleared")
     
     def get_simulated_state(self) -> Dict[str, Any]:
@@ -301,18 +424,11 @@ class MockTuxDriver(TuxDriverInterface):
         Returns:
             dict: Current state (eyes, mouth, wings, LEDs, etc.)
         """
-        return self._state.copy()
+        return dict(self._state_snapshot())
     
     def reset_state(self):
         """Reset simulated state to defaults."""
-        self._state = {
-            "eyes": "open",
-            "mouth": "closed",
-            "wings": "lowered",
-            "leds_left": "off",
-            "leds_right": "off",
-            "sleeping": False,
-            "rotation": 0,
-        }
+        self._state_bits = _DEFAULT_STATE_BITS
+        self._state_version += 1
         logger.info("🐧 [MOCK] State reset to defaults")
 
@@ -0,0 +1,14 @@
+"""
+TUX Droid AI Control - Shared Test Fixtures
+===========================================
+"""
+
+import pytest
+
+from stubs.mock_driver import MockTuxDriver
+
+
+@pytest.fixture(autouse=True)
+def no_simulated_delay(monkeypatch):
+    """Skip the mock driver's simulated delays during tests."""
+    monkeypatch.setattr(MockTuxDriver, "_sleep", staticmethod(lambda seconds: None))
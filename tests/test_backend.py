@@ -8,16 +8,25 @@ Basic tests for the FastAPI backend.
 import pytest
 from fastapi.testclient import TestClient
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
+    """Create a test client for the FastAPI app, shared across the session."""
     from backend.main import app
-    return TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def reset_driver(client):
+    """Restore the mock driver to a clean, connected state after each test."""
+    yield
+    from backend.main import tux_controller
+    driver = tux_controller.driver
+    driver.reset_state()
+    driver.clear_history()
+    if not driver.is_connected():
+        driver.connect()
 
 
 class TestHealthEndpoints:
@@ -48,98 +57,37 @@ class TestHealthEndpoints:
         data = response.json()
         assert "connected" in data
         assert "driver_type" in data
+    
+    def test_status_reflects_state_changes(self, client):
+        """Test status returns fresh simulated state after an action."""
+        before = client.get("/status").json()
+        assert before["simulated_state"]["eyes"] == "open"
+        client.post("/tux/eyes", json={"action": "close"})
+        after = client.get("/status").json()
+        assert after["simulated_state"]["eyes"] == "closed"
 
 
 class TestTuxEndpoints:
     """Tests for TUX control endpoints."""
     
-    def test_eyes_blink(self, client):
-        """Test eyes blink endpoint."""
-        response = client.post("/tux/eyes", json={
-            "action": "blink",
-            "count": 3
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] == True
-        assert data["action"] == "blink_eyes"
-    
-    def test_eyes_open(self, client):
-        """Test eyes open endpoint."""
-        response = client.post("/tux/eyes", json={"action": "open"})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] == True
-    
-    def test_mouth_move(self, client):
-        """Test mouth move endpoint."""
-        response = client.post("/tux/mouth", json={
-            "action": "move",
-            "count": 2
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] == True
-    
-    def test_wings_wave(self, client):
-        """Test wings wave endpoint."""
-        response = client.post("/tux/wings", json={
-            "action": "wave",
-            "count": 3,
-            "speed": 4
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] == True
-    
-    def test_spin_left(self, client):
-        """Test spin left endpoint."""
-        response = client.post("/tux/spin", json={
-            "action": "left",
-            "angle": 4,
-            "speed": 3
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] == True
-    
-    def test_leds_on(self, client):
-        """Test LEDs on endpoint."""
-        response = client.post("/tux/leds", json={
-            "action": "on",
-            "target": "both"
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] == True
-    
-    def test_sound_play(self, client):
-        """Test sound play endpoint."""
-        response = client.post("/tux/sound", json={
-            "action": "play",
-            "sound_number": 0,
-            "volume": 100
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] == True
-    
-    def test_sleep(self, client):
-        """Test sleep endpoint."""
-        response = client.post("/tux/sleep", json={
-            "action": "sleep",
-            "mode": "normal"
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] == True
-    
-    def test_wake_up(self, client):
-        """Test wake up endpoint."""
-        response = client.post("/tux/sleep", json={"action": "wake"})
+    @pytest.mark.parametrize("endpoint,payload,expected_action", [
+        ("/tux/eyes", {"action": "blink", "count": 3}, "blink_eyes"),
+        ("/tux/eyes", {"action": "open"}, "open_eyes"),
+        ("/tux/mouth", {"action": "move", "count": 2}, "move_mouth"),
+        ("/tux/wings", {"action": "wave", "count": 3, "speed": 4}, "wave_wings"),
+        ("/tux/spin", {"action": "left", "angle": 4, "speed": 3}, "spin_left"),
+        ("/tux/leds", {"action": "on", "target": "both"}, "led_on"),
+        ("/tux/sound", {"action": "play", "sound_number": 0, "volume": 100}, "play_sound"),
+        ("/tux/sleep", {"action": "sleep", "mode": "normal"}, "sleep"),
+        ("/tux/sleep", {"action": "wake"}, "wake_up"),
+    ])
+    def test_action_endpoints(self, client, endpoint, payload, expected_action):
+        """Test each control endpoint executes the expected action."""
+        response = client.post(endpoint, json=payload)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] == True
+        assert data["action"] == expected_action
     
     def test_custom_action(self, client):
         """Test custom action endpoint."""
@@ -158,6 +106,64 @@ class TestTuxEndpoints:
             "params": {}
         })
         assert response.status_code == 400
+    
+    def test_batch_actions(self, client):
+        """Test batch endpoint executes every action in order."""
+        response = client.post("/tux/batch", json={"actions": [
+            {"action_type": "close_eyes", "params": {}},
+            {"action_type": "raise_wings", "params": {}},
+        ]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == True
+        assert data["params"]["actions"] == ["close_eyes", "raise_wings"]
+        state = client.get("/status").json()["simulated_state"]
+        assert state["eyes"] == "closed"
+        assert state["wings"] == "raised"
+    
+    def test_batch_merges_repeated_actions(self, client):
+        """Test consecutive repeatable actions are merged into one command."""
+        response = client.post("/tux/batch", json={"actions": [
+            {"action_type": "blink_eyes", "params": {"count": 2}},
+            {"action_type": "blink_eyes", "params": {"count": 3}},
+            {"action_type": "open_eyes", "params": {}},
+        ]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == True
+        assert data["params"]["actions"] == ["blink_eyes", "open_eyes"]
+        
+        from backend.main import tux_controller
+        history = tux_controller.driver.get_action_history(iso=False)
+        assert [(record["action"], record["params"]) for record in history[-2:]] == [
+            ("blink_eyes", {"count": 5}),
+            ("open_eyes", {}),
+        ]
+    
+    def test_batch_invalid_action(self, client):
+        """Test batch with an unknown action type returns error."""
+        response = client.post("/tux/batch", json={"actions": [
+            {"action_type": "invalid_action", "params": {}},
+        ]})
+        assert response.status_code == 400
+    
+    @pytest.mark.parametrize("action", [
+        {"action_type": "blink_eyes", "params": {"count": 300}},
+        {"action_type": "blink_eyes", "params": {"count": 2.9}},
+        {"action_type": "blink_eyes", "params": {"count": True}},
+        {"action_type": "led_on", "params": {"target": "middle"}},
+        {"action_type": "led_on", "params": {"target": ["left"]}},
+        {"action_type": "sleep", "params": {"mode": {"a": 1}}},
+        {"action_type": "sleep", "params": {"mode": "nap"}},
+        {"action_type": "play_sound", "params": {"sound_number": "abc"}},
+        {"action_type": "play_sound", "params": {"sound_number": 256}},
+        {"action_type": "led_pulse", "params": {"pulse_width": 0}},
+        {"action_type": "ir_send", "params": {}},
+    ])
+    def test_invalid_action_rejected_by_custom_and_batch(self, client, action):
+        """Test the custom and batch endpoints reject the same invalid actions."""
+        assert client.post("/tux/custom", json=action).status_code == 400
+        assert client.post("/tux/batch", json={"actions": [action]}).status_code == 400
 
 
 class TestConnectionEndpoints:
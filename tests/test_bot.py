@@ -6,9 +6,6 @@ Basic tests for the Telegram bot components.
 """
 
 import pytest
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from bot.keyboards import (
     CallbackData,
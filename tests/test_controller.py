@@ -0,0 +1,241 @@
+"""
+TUX Droid AI Control - Controller Tests
+=======================================
+
+Tests for TuxController on top of the mock driver.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from stubs.mock_driver import MockTuxDriver
+from tux.actions import MAX_REPEAT_COUNT, TuxAction, coalesce_actions
+from tux.controller import TuxController
+
+
+class RecordingDriver(MockTuxDriver):
+    """Mock driver that records the calling thread and can hold writes."""
+    
+    __slots__ = ("threads", "gate")
+    
+    def __init__(self):
+        super().__init__(simulate_delay=False, verbose=False)
+        self.threads = []
+        self.gate = threading.Event()
+        self.gate.set()
+    
+    def execute_action(self, action):
+        self.threads.append(threading.current_thread().name)
+        self.gate.wait(5)
+        return super().execute_action(action)
+    
+    def batch_execute(self, actions):
+        self.threads.append(threading.current_thread().name)
+        return super().batch_execute(actions)
+
+
+def executed(driver):
+    """Action values the driver has executed, oldest first."""
+    return [
+        record["action"] for record in driver.get_action_history(iso=False)
+        if record["action"] not in ("CONNECT", "DISCONNECT")
+    ]
+
+
+@pytest.fixture
+def controller():
+    """Connected controller on a recording driver."""
+    tux = TuxController(RecordingDriver())
+    tux.connect()
+    yield tux
+    tux.driver.gate.set()
+    tux.disconnect()
+
+
+class TestExecuteAsync:
+    """Tests for the background writer."""
+    
+    def test_results_in_submission_order(self, controller):
+        """Test queued actions resolve in order with the usual result dicts."""
+        futures = [
+            controller.execute_async(TuxAction.blink_eyes(2)),
+            controller.execute_async(TuxAction.wave_wings(1, 3)),
+            controller.execute_async(TuxAction.open_mouth()),
+        ]
+        results = [future.result(timeout=5) for future in futures]
+        assert [result["action"] for result in results] == ["blink_eyes", "wave_wings", "open_mouth"]
+        assert all(result["success"] for result in results)
+        assert executed(controller.driver) == ["blink_eyes", "wave_wings", "open_mouth"]
+    
+    def test_sync_calls_queue_behind_async_actions(self, controller):
+        """Test synchronous calls run on the writer after pending actions."""
+        controller.driver.gate.clear()
+        future = controller.execute_async(TuxAction.blink_eyes(1))
+        sync_done = threading.Event()
+        
+        def call_sync():
+            controller.close_eyes()
+            with controller.batch():
+                controller.wave_wings(2)
+            sync_done.set()
+        
+        caller = threading.Thread(target=call_sync)
+        caller.start()
+        assert not sync_done.wait(0.05)
+        controller.driver.gate.set()
+        caller.join(5)
+        
+        assert future.result(timeout=5)["success"]
+        assert executed(controller.driver) == ["blink_eyes", "close_eyes", "wave_wings"]
+        assert set(controller.driver.threads) == {"TuxControllerWriter"}
+    
+    def test_aexecute_waits_for_a_slot_off_the_event_loop(self, controller):
+        """Test aexecute() lets the loop run while the in-flight slots are full."""
+        controller.driver.gate.clear()
+        futures = [controller.execute_async(TuxAction.blink_eyes(1)) for _ in range(3)]
+        
+        async def main():
+            task = asyncio.ensure_future(controller.aexecute(TuxAction.open_eyes()))
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            controller.driver.gate.set()
+            return await asyncio.wait_for(task, 5)
+        
+        result = asyncio.run(main())
+        assert result["action"] == "open_eyes"
+        assert all(future.result(timeout=5)["success"] for future in futures)
+        assert executed(controller.driver) == ["blink_eyes"] * 3 + ["open_eyes"]
+    
+    def test_disconnect_drains_queue(self, controller):
+        """Test disconnecting finishes every queued action first."""
+        futures = [controller.execute_async(TuxAction.blink_eyes(1)) for _ in range(3)]
+        controller.disconnect()
+        assert all(future.done() for future in futures)
+        assert executed(controller.driver) == ["blink_eyes"] * 3
+
+
+class TestBatch:
+    """Tests for begin_batch(), end_batch() and batch()."""
+    
+    def test_batch_sends_once_on_exit(self, controller):
+        """Test actions in a batch block are queued then sent as one batch."""
+        with controller.batch():
+            result = controller.blink_eyes(2)
+            controller.wave_wings(3)
+            assert result["message"] == "Action 'blink_eyes' queued"
+            assert executed(controller.driver) == []
+        assert executed(controller.driver) == ["blink_eyes", "wave_wings"]
+        assert controller.driver.threads == ["TuxControllerWriter"]
+    
+    def test_end_batch_result(self, controller):
+        """Test end_batch() reports the batched action types."""
+        controller.begin_batch()
+        controller.led_on("left")
+        controller.open_mouth()
+        result = controller.end_batch()
+        assert result["success"]
+        assert result["params"] == {"actions": ["led_on", "open_mouth"]}
+    
+    def test_nested_or_unstarted_batches_rejected(self, controller):
+        """Test begin_batch() twice and end_batch() alone raise RuntimeError."""
+        with pytest.raises(RuntimeError):
+            controller.end_batch()
+        controller.begin_batch()
+        with pytest.raises(RuntimeError):
+            controller.begin_batch()
+        controller.end_batch()
+    
+    def test_exception_discards_batch(self, controller):
+        """Test an exception inside batch() drops the queued actions."""
+        with pytest.raises(KeyError):
+            with controller.batch():
+                controller.blink_eyes(1)
+                raise KeyError("boom")
+        assert executed(controller.driver) == []
+        controller.begin_batch()
+        controller.end_batch()
+
+
+class TestCoalesceActions:
+    """Tests for merging repeated actions."""
+    
+    def test_merges_consecutive_repeats(self):
+        """Test neighbouring repeatable actions add up their counts."""
+        merged = coalesce_actions([
+            TuxAction.blink_eyes(2), TuxAction.blink_eyes(3),
+            TuxAction.open_eyes(), TuxAction.blink_eyes(1),
+        ])
+        assert [(action.type_value, dict(action.params)) for action in merged] == [
+            ("blink_eyes", {"count": 5}),
+            ("open_eyes", {}),
+            ("blink_eyes", {"count": 1}),
+        ]
+    
+    def test_different_params_not_merged(self):
+        """Test repeats with different non-count params stay separate."""
+        merged = coalesce_actions([TuxAction.wave_wings(2, 3), TuxAction.wave_wings(2, 5)])
+        assert [action.params["speed"] for action in merged] == [3, 5]
+    
+    def test_count_capped_at_firmware_byte(self):
+        """Test a merge that would pass MAX_REPEAT_COUNT starts a new action."""
+        merged = coalesce_actions([
+            TuxAction.blink_eyes(200), TuxAction.blink_eyes(55), TuxAction.blink_eyes(1),
+        ])
+        assert MAX_REPEAT_COUNT == 255
+        assert [action.params["count"] for action in merged] == [255, 1]
+
+
+class TestResults:
+    """Tests for the result dicts returned by actions."""
+    
+    def test_parameterless_result_params_are_fresh_dicts(self, controller):
+        """Test parameterless actions return their own plain params dict."""
+        first = controller.open_eyes()
+        second = controller.open_eyes()
+        assert list(first) == ["success", "action", "params", "message"]
+        assert type(first["params"]) is dict
+        first["params"].update(extra=1)
+        assert second["params"] == {}
+        assert controller.open_eyes()["params"] == {}
+
+
+class TestDispatch:
+    """Tests for executing actions by name."""
+    
+    def test_dispatch_passes_accepted_params(self, controller):
+        """Test dispatch() forwards known params and ignores the rest."""
+        result = controller.dispatch("wave_wings", {"count": 2, "speed": 4, "volume": 9})
+        assert result["success"]
+        history = controller.driver.get_action_history(iso=False)
+        assert history[-1]["params"] == {"count": 2, "speed": 4}
+    
+    def test_dispatch_defaults(self, controller):
+        """Test dispatch() without params uses the action defaults."""
+        assert controller.dispatch("blink_eyes")["success"]
+        assert controller.driver.get_action_history(iso=False)[-1]["params"] == {"count": 1}
+    
+    def test_dispatch_unknown_action(self, controller):
+        """Test dispatch() rejects unknown action names."""
+        with pytest.raises(ValueError, match="Unknown action type"):
+            controller.dispatch("fly")
+    
+    def test_dispatch_many_merges_repeats(self, controller):
+        """Test dispatch_many() coalesces repeated movements into one command."""
+        result = controller.dispatch_many([
+            ("blink_eyes", {"count": 2}),
+            ("blink_eyes", {"count": 3}),
+            ("open_mouth", None),
+        ])
+        assert result["params"] == {"actions": ["blink_eyes", "open_mouth"]}
+        history = controller.driver.get_action_history(iso=False)
+        assert history[-2]["params"] == {"count": 5}
+    
+    def test_dispatch_many_rejects_whole_batch(self, controller):
+        """Test one invalid entry sends nothing and leaves no batch open."""
+        with pytest.raises(ValueError):
+            controller.dispatch_many([("blink_eyes", None), ("led_on", {"target": "middle"})])
+        assert executed(controller.driver) == []
+        controller.begin_batch()
+        controller.end_batch()
@@ -0,0 +1,374 @@
+"""
+TUX Droid AI Control - Driver Tests
+===================================
+
+Tests for TuxDriver against a fake pyusb device.
+"""
+
+import threading
+import time
+import types
+
+import pytest
+import usb.core
+import usb.util
+
+import tux.driver as driver_module
+from stubs.mock_driver import MockTuxDriver
+from tux.actions import ActionType, LEDTarget, TuxAction
+from tux.controller import TuxController
+from tux.driver import TuxDriver
+
+
+class FakeEndpoint:
+    """Interrupt endpoint that records every write."""
+    
+    def __init__(self, address: int = driver_module.TUX_ENDPOINT_OUT):
+        self.bEndpointAddress = address
+        self.writes = []
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+    
+    def write(self, data, timeout=None):
+        self.entered.set()
+        self.gate.wait(5)
+        self.writes.append(bytes(data))
+        return len(data)
+    
+    def read(self, size, timeout=None):
+        raise usb.core.USBError("timeout")
+
+
+class FakeDevice:
+    """USB device exposing the TUX HID interface endpoints."""
+    
+    bus = 1
+    address = 2
+    
+    def __init__(self):
+        self.endpoint_out = FakeEndpoint()
+        self.endpoint_in = FakeEndpoint(driver_module.TUX_ENDPOINT_IN)
+    
+    def is_kernel_driver_active(self, interface):
+        return False
+    
+    def set_configuration(self):
+        pass
+    
+    def get_active_configuration(self):
+        return {(driver_module.TUX_INTERFACE, 0): [self.endpoint_out, self.endpoint_in]}
+
+
+def wait_for(condition, timeout=2.0):
+    """Poll until condition() is true or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+@pytest.fixture(autouse=True)
+def device_cache(monkeypatch):
+    """Give every test an empty device cache."""
+    cache = {}
+    monkeypatch.setattr(driver_module, "_DEVICE_CACHE", cache)
+    return cache
+
+
+@pytest.fixture
+def usb_bus(monkeypatch):
+    """Fake pyusb lookups; returns the list of devices handed out."""
+    found = []
+    
+    def find(**kwargs):
+        found.append(FakeDevice())
+        return found[-1]
+    
+    monkeypatch.setattr(usb.core, "find", find)
+    monkeypatch.setattr(usb.util, "claim_interface", lambda device, interface: None)
+    monkeypatch.setattr(usb.util, "release_interface", lambda device, interface: None)
+    monkeypatch.setattr(usb.util, "dispose_resources", lambda device: None)
+    return found
+
+
+@pytest.fixture
+def make_driver(usb_bus):
+    """Connect TuxDrivers to a fake device, disconnecting them afterwards."""
+    drivers = []
+    
+    def make(**kwargs):
+        driver = TuxDriver(**kwargs)
+        assert driver.connect()
+        endpoint = usb_bus[-1].endpoint_out
+        # Forget the ping sent on connect
+        endpoint.writes.clear()
+        drivers.append((driver, endpoint))
+        return driver, endpoint
+    
+    yield make
+    for driver, endpoint in drivers:
+        endpoint.gate.set()
+        driver.disconnect()
+
+
+class TestCoalescing:
+    """Tests for merging repeatable actions inside the coalescing window."""
+    
+    def test_merged_count(self, make_driver):
+        """Test identical repeats are held and sent as one command."""
+        driver, endpoint = make_driver(coalesce_window_ms=1000)
+        assert driver.execute_action(TuxAction.blink_eyes(2))
+        assert driver.execute_action(TuxAction.blink_eyes(3))
+        assert endpoint.writes == []
+        assert driver.flush_pending()
+        assert endpoint.writes == [bytes([0x40, 5, 0, 0])]
+    
+    def test_count_capped(self, make_driver):
+        """Test a merge past the firmware count byte sends the held action."""
+        driver, endpoint = make_driver(coalesce_window_ms=1000)
+        driver.execute_action(TuxAction.blink_eyes(200))
+        driver.execute_action(TuxAction.blink_eyes(100))
+        assert endpoint.writes == [bytes([0x40, 200, 0, 0])]
+        driver.flush_pending()
+        assert endpoint.writes[-1] == bytes([0x40, 100, 0, 0])
+    
+    def test_flush_on_timer(self, make_driver):
+        """Test the held action is sent once the window expires."""
+        driver, endpoint = make_driver(coalesce_window_ms=10)
+        driver.execute_action(TuxAction.blink_eyes(2))
+        assert wait_for(lambda: endpoint.writes)
+        assert endpoint.writes == [bytes([0x40, 2, 0, 0])]
+    
+    def test_flush_on_mismatch(self, make_driver):
+        """Test a different action sends the held one first."""
+        driver, endpoint = make_driver(coalesce_window_ms=1000)
+        driver.execute_action(TuxAction.blink_eyes(2))
+        driver.execute_action(TuxAction.open_eyes())
+        assert endpoint.writes == [bytes([0x40, 2, 0, 0]), bytes([0x33, 0, 0, 0])]
+    
+    def test_stale_timer_keeps_next_action(self, make_driver, monkeypatch):
+        """Test a timer that fires late does not flush an action held after it."""
+        timers = []
+        
+        class ManualTimer:
+            def __init__(self, interval, function, args=()):
+                self.daemon = False
+                timers.append((function, args))
+            
+            def start(self):
+                pass
+            
+            def cancel(self):
+                pass
+        
+        monkeypatch.setattr(driver_module.threading, "Timer", ManualTimer)
+        driver, endpoint = make_driver(coalesce_window_ms=1000)
+        driver.execute_action(TuxAction.blink_eyes(2))
+        driver.execute_action(TuxAction.open_eyes())
+        driver.execute_action(TuxAction.move_mouth(3))
+        assert len(endpoint.writes) == 2
+        
+        function, args = timers[0]
+        function(*args)
+        assert len(endpoint.writes) == 2
+        function, args = timers[1]
+        function(*args)
+        assert endpoint.writes[-1] == bytes([0x41, 3, 0, 0])
+    
+    def test_flush_on_disconnect(self, make_driver):
+        """Test disconnecting sends the held action."""
+        driver, endpoint = make_driver(coalesce_window_ms=1000)
+        driver.execute_action(TuxAction.move_mouth(4))
+        driver.disconnect()
+        assert endpoint.writes == [bytes([0x41, 4, 0, 0])]
+
+
+class TestCommandPadding:
+    """Tests for padding raw commands to CMD_SIZE."""
+    
+    def test_short_and_long_commands(self, make_driver):
+        """Test short commands are zero-padded and long ones truncated."""
+        driver, endpoint = make_driver()
+        assert driver.send_command(bytes([0x33]))
+        assert driver.send_command(bytes([0x40, 2]))
+        assert driver.send_command(bytes([0x40, 3, 0, 0, 9]))
+        assert endpoint.writes == [bytes([0x33, 0, 0, 0]), bytes([0x40, 2, 0, 0]), bytes([0x40, 3, 0, 0])]
+    
+    def test_concurrent_short_commands(self, make_driver):
+        """Test short commands written from several threads never mix their bytes."""
+        driver, endpoint = make_driver()
+        commands = [bytes([code]) for code in range(0x30, 0x38)]
+        
+        def send(command):
+            for _ in range(50):
+                driver.send_command(command)
+        
+        threads = [threading.Thread(target=send, args=(command,)) for command in commands]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(endpoint.writes) == 400
+        assert set(endpoint.writes) == {command + bytes(3) for command in commands}
+
+
+class TestQueuedWrites:
+    """Tests for the writer thread behind queued_writes."""
+    
+    def test_write_order(self, make_driver):
+        """Test queued commands reach the endpoint in submission order."""
+        driver, endpoint = make_driver(queued_writes=True)
+        commands = [bytes([0x40, count, 0, 0]) for count in range(1, 21)]
+        for command in commands[:10]:
+            assert driver.send_command(command)
+        assert driver.send_commands(commands[10:]) == 10
+        assert driver.send_command_sync(bytes([0x33, 0, 0, 0]))
+        assert endpoint.writes == commands + [bytes([0x33, 0, 0, 0])]
+    
+    def test_full_queue_fails_send(self, make_driver):
+        """Test a send fails instead of waiting forever when the queue stays full."""
+        driver, endpoint = make_driver(queued_writes=True, max_queued_writes=1, write_timeout_ms=20)
+        endpoint.gate.clear()
+        assert driver.send_command(bytes([0x33, 0, 0, 0]))
+        assert endpoint.entered.wait(2)
+        assert driver.send_command(bytes([0x34, 0, 0, 0]))
+        assert not driver.send_command(bytes([0x35, 0, 0, 0]))
+        assert driver.get_status()["commands_failed"] == 1
+        endpoint.gate.set()
+        assert driver.drain()
+        assert endpoint.writes == [bytes([0x33, 0, 0, 0]), bytes([0x34, 0, 0, 0])]
+
+
+class TestPackedWrites:
+    """Tests for packing commands into 64-byte reports."""
+    
+    def test_sixteen_frames_per_report(self, make_driver):
+        """Test send_commands() packs up to 16 frames into each report."""
+        driver, endpoint = make_driver(pack_commands=True)
+        commands = [bytes([0x40, count, 0, 0]) for count in range(1, 21)]
+        assert driver.send_commands(commands) == 20
+        assert [len(report) for report in endpoint.writes] == [64, 16]
+        assert b"".join(endpoint.writes) == b"".join(commands)
+    
+    def test_short_commands_padded(self, make_driver):
+        """Test commands shorter than a frame are zero-padded in the report."""
+        driver, endpoint = make_driver(pack_commands=True)
+        driver.send_commands([bytes([0x33]), bytes([0x40, 2])])
+        assert endpoint.writes == [bytes([0x33, 0, 0, 0, 0x40, 2, 0, 0])]
+    
+    def test_batch_packed(self, make_driver):
+        """Test batch_execute() sends the whole batch as one report."""
+        driver, endpoint = make_driver(pack_commands=True)
+        assert driver.batch_execute([
+            TuxAction.blink_eyes(2), TuxAction.led_on(LEDTarget.LEFT), TuxAction.open_mouth(),
+        ])
+        assert endpoint.writes == [bytes([0x40, 2, 0, 0, 0x1A, 0, 0, 0, 0x34, 0, 0, 0])]
+    
+    def test_led_target_member_encoded(self):
+        """Test an LEDTarget member (a str subclass) maps to its target code."""
+        command = driver_module._build_one_param(ActionType.LED_ON, 0x5A, {"target": LEDTarget.RIGHT})
+        assert command == bytes([0x5A, 0x02, 0, 0])
+
+
+class TestDeviceCache:
+    """Tests for reusing and evicting the resolved USB device."""
+    
+    def test_reconnect_reuses_device(self, usb_bus, device_cache):
+        """Test a second connect skips the bus scan."""
+        driver = TuxDriver()
+        assert driver.connect()
+        driver.disconnect()
+        assert driver.connect()
+        driver.disconnect()
+        assert len(usb_bus) == 1
+        assert device_cache[(driver_module.TUX_VENDOR_ID, driver_module.TUX_PRODUCT_ID)][0] is usb_bus[0]
+    
+    def test_stale_device_evicted_and_retried(self, usb_bus, device_cache, monkeypatch):
+        """Test a cached device that fails to claim is dropped and looked up again."""
+        driver = TuxDriver()
+        assert driver.connect()
+        driver.disconnect()
+        stale = usb_bus[0]
+        
+        def claim(device, interface):
+            if device is stale:
+                raise usb.core.USBError("No such device")
+        
+        monkeypatch.setattr(usb.util, "claim_interface", claim)
+        assert driver.connect()
+        assert len(usb_bus) == 2
+        assert device_cache[(driver_module.TUX_VENDOR_ID, driver_module.TUX_PRODUCT_ID)][0] is usb_bus[1]
+        assert usb_bus[1].endpoint_out.writes
+        driver.disconnect()
+
+
+class UdevDevice(dict):
+    """udev event for the TUX dongle."""
+    
+    def __init__(self, action):
+        super().__init__(PRODUCT=driver_module._TUX_UDEV_PRODUCT + "100")
+        self.action = action
+
+
+@pytest.fixture
+def fake_pyudev(monkeypatch):
+    """Stand in for pyudev; returns the callbacks handed to MonitorObserver."""
+    callbacks = []
+    
+    class Monitor:
+        @staticmethod
+        def from_netlink(context):
+            return Monitor()
+        
+        def filter_by(self, subsystem, device_type=None):
+            pass
+    
+    class MonitorObserver:
+        def __init__(self, monitor, callback, name):
+            callbacks.append(callback)
+        
+        def start(self):
+            pass
+        
+        def stop(self):
+            pass
+    
+    monkeypatch.setattr(driver_module, "_HAVE_PYUDEV", True)
+    monkeypatch.setattr(driver_module, "pyudev", types.SimpleNamespace(
+        Context=lambda: None, Monitor=Monitor, MonitorObserver=MonitorObserver,
+    ))
+    return callbacks
+
+
+class TestHotplug:
+    """Tests for connecting on udev hotplug events."""
+    
+    def test_unplug_evicts_device(self, usb_bus, device_cache, fake_pyudev):
+        """Test a remove event drops the cached device and disconnects."""
+        driver = TuxDriver()
+        assert driver.watch_hotplug()
+        assert driver.connect()
+        fake_pyudev[0](UdevDevice("remove"))
+        assert device_cache == {}
+        assert not driver.is_connected()
+    
+    def test_plug_in_connects_through_controller(self, usb_bus, fake_pyudev):
+        """Test an add event runs the controller's connect, restarting its writer."""
+        controller = TuxController(TuxDriver())
+        connects = []
+        controller_connect = controller.connect
+        controller.connect = lambda: connects.append(True) or controller_connect()
+        assert controller.watch_hotplug()
+        fake_pyudev[0](UdevDevice("add"))
+        assert connects == [True]
+        assert controller.is_connected()
+        assert controller.blink_eyes(2)["success"]
+        assert usb_bus[0].endpoint_out.writes[-1] == bytes([0x40, 2, 0, 0])
+        controller.disconnect()
+    
+    def test_mock_driver_has_no_hotplug(self):
+        """Test the controller reports no hotplug support for other drivers."""
+        assert not TuxController(MockTuxDriver(simulate_delay=False, verbose=False)).watch_hotplug()
@@ -0,0 +1,64 @@
+"""
+TUX Droid AI Control - Mock Driver Tests
+========================================
+
+Tests for the simulated driver's history and state reporting.
+"""
+
+import json
+
+import pytest
+
+from stubs.mock_driver import MockTuxDriver
+from tux.actions import TuxAction
+
+
+@pytest.fixture
+def driver():
+    """Connected mock driver without delays or visual output."""
+    mock = MockTuxDriver(simulate_delay=False, verbose=False)
+    mock.connect()
+    return mock
+
+
+class TestActionHistory:
+    """Tests for recorded actions."""
+    
+    def test_params_copied(self, driver):
+        """Test changing an action's params after executing it leaves history alone."""
+        action = TuxAction.blink_eyes(2)
+        driver.execute_action(action)
+        action.params["count"] = 9
+        assert driver.get_action_history(iso=False)[-1]["params"] == {"count": 2}
+    
+    def test_history_serializable(self, driver):
+        """Test history records hold plain dicts that JSON can encode."""
+        driver.execute_action(TuxAction.open_eyes())
+        driver.execute_action(TuxAction.blink_eyes(2))
+        for iso in (True, False):
+            history = driver.get_action_history(iso=iso)
+            json.dumps(history)
+            assert all(type(record["state_snapshot"]) is dict for record in history)
+            assert all(type(record["params"]) is dict for record in history)
+    
+    def test_snapshots_not_shared(self, driver):
+        """Test changing one record's snapshot leaves the others alone."""
+        driver.execute_action(TuxAction.blink_eyes(1))
+        driver.execute_action(TuxAction.blink_eyes(2))
+        first, second = driver.get_action_history(iso=False)[-2:]
+        first["state_snapshot"]["eyes"] = "changed"
+        assert second["state_snapshot"]["eyes"] != "changed"
+
+
+class TestStateReporting:
+    """Tests for the simulated state views."""
+    
+    def test_state_is_a_dict(self, driver):
+        """Test get_simulated_state() and get_status() return plain dicts."""
+        driver.execute_action(TuxAction.close_eyes())
+        state = driver.get_simulated_state()
+        assert type(state) is dict
+        assert state["eyes"] == "closed"
+        status = driver.get_status()
+        assert type(status["simulated_state"]) is dict
+        json.dumps(status)
@@ -7,13 +7,14 @@ High-level TUX Droid control abstraction layer.
 
 from .controller import TuxController
 from .actions import TuxAction, ActionType
-from .driver import TuxDriver, TuxDriverInterface
+from .driver import TuxDriver, HidTuxDriver, TuxDriverInterface
 
 __all__ = [
     "TuxController",
     "TuxAction",
     "ActionType",
     "TuxDriver",
+    "HidTuxDriver",
     "TuxDriverInterface",
 ]
 
@@ -7,12 +7,26 @@ Based on the firmware commands from tuxcore/common/commands.h
 """
 
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional, Any, Dict
+from types import MappingProxyType
+from typing import Optional, Any, Iterable, List, Mapping
 
 
 class ActionType(str, Enum):
-    """Enumeration of all available TUX Droid action types."""
+    """
+    Enumeration of all available TUX Droid action types.
+    
+    Values are the public action names used by the API. Each member also
+    carries a dense integer ``ordinal`` (its definition order) so hot paths
+    can index flat tables instead of hashing enum members.
+    """
+    
+    ordinal: int
+    
+    def __new__(cls, value: str):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.ordinal = len(cls.__members__)
+        return member
     
     # Eye actions
     BLINK_EYES = "blink_eyes"
@@ -75,22 +89,95 @@ class SleepMode(str, Enum):
     DEEP = "deep"
 
 
-@dataclass
+# Parameters the firmware receives as a single byte, with their accepted
+# range. "target" may also be an LED target name, which the driver maps to
+# its code.
+_BYTE_PARAM_RANGES = MappingProxyType({
+    **{key: (0, 0xFF) for key in (
+        "count", "angle", "speed", "delay", "volume", "state", "target",
+        "sound_number", "param1", "param2", "param3",
+    )},
+    "pulse_width": (1, 0xFF),
+})
+
+# Sleep modes are passed by name and converted by the driver
+_SLEEP_MODE_NAMES = frozenset(mode.value for mode in SleepMode)
+
+
+def _validate_params(params: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Coerce byte parameters to int and check their range and sleep modes.
+    
+    Integral floats and numeric strings are converted; bools and
+    fractional values are rejected rather than truncated. Returns the
+    params unchanged when nothing needs coercing, otherwise a coerced
+    copy, so the caller's dict is never modified.
+    
+    Raises:
+        ValueError: If a byte parameter is not an integer in its range,
+            or a sleep mode is unknown
+    """
+    coerced = None
+    for key, value in params.items():
+        if key == "mode":
+            if not isinstance(value, str) or value not in _SLEEP_MODE_NAMES:
+                raise ValueError(
+                    f"Parameter 'mode' must be one of {sorted(_SLEEP_MODE_NAMES)}, got {value!r}"
+                )
+            continue
+        limits = _BYTE_PARAM_RANGES.get(key)
+        if limits is None or (key == "target" and isinstance(value, str)):
+            continue
+        if value.__class__ is not int:
+            number = None
+            if value.__class__ is not bool:
+                try:
+                    number = int(value)
+                except (TypeError, ValueError):
+                    pass
+            # int() truncates floats, so only accept exact conversions
+            if number is None or (not isinstance(value, str) and number != value):
+                raise ValueError(f"Parameter {key!r} must be an integer, got {value!r}")
+            value = number
+            if coerced is None:
+                coerced = dict(params)
+            coerced[key] = value
+        low, high = limits
+        if not low <= value <= high:
+            raise ValueError(f"Parameter {key!r} must be between {low} and {high}, got {value}")
+    return params if coerced is None else coerced
+
+
 class TuxAction:
     """
     Represents a TUX Droid action with its parameters.
     
+    Byte parameters (counts, angles, speeds, ...) are validated once here,
+    so the driver can encode them without further checks.
+    
     Attributes:
         action_type: The type of action to perform
-        params: Dictionary of action-specific parameters
+        params: Mapping of action-specific parameters (read-only for the
+            shared parameterless actions)
+        type_value: The action name (``action_type.value``), cached at creation
     """
-    action_type: ActionType
-    params: Dict[str, Any]
     
-    def __post_init__(self):
-        """Validate action parameters."""
-        if self.params is None:
-            self.params = {}
+    __slots__ = ("action_type", "params", "type_value")
+    
+    def __init__(self, action_type: ActionType, params: Optional[Mapping[str, Any]] = None):
+        self.action_type = action_type
+        self.params: Mapping[str, Any] = {} if params is None else _validate_params(params)
+        self.type_value = action_type.value
+    
+    def __repr__(self) -> str:
+        return f"TuxAction(action_type={self.action_type!r}, params={self.params!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.action_type == other.action_type and self.params == other.params
+    
+    __hash__ = None  # type: ignore[assignment]
     
     @classmethod
     def blink_eyes(cls, count: int = 1) -> "TuxAction":
@@ -100,12 +187,17 @@ class TuxAction:
     @classmethod
     def open_eyes(cls) -> "TuxAction":
         """Create an open eyes action."""
-        return cls(ActionType.OPEN_EYES, {})
+        return _PARAMLESS_ACTIONS[ActionType.OPEN_EYES]
     
     @classmethod
     def close_eyes(cls) -> "TuxAction":
         """Create a close eyes action."""
-        return cls(ActionType.CLOSE_EYES, {})
+        return _PARAMLESS_ACTIONS[ActionType.CLOSE_EYES]
+    
+    @classmethod
+    def stop_eyes(cls) -> "TuxAction":
+        """Create a stop eyes action."""
+        return _PARAMLESS_ACTIONS[ActionType.STOP_EYES]
     
     @classmethod
     def move_mouth(cls, count: int = 1) -> "TuxAction":
@@ -115,12 +207,17 @@ class TuxAction:
     @classmethod
     def open_mouth(cls) -> "TuxAction":
         """Create an open mouth action."""
-        return cls(ActionType.OPEN_MOUTH, {})
+        return _PARAMLESS_ACTIONS[ActionType.OPEN_MOUTH]
     
     @classmethod
     def close_mouth(cls) -> "TuxAction":
         """Create a close mouth action."""
-        return cls(ActionType.CLOSE_MOUTH, {})
+        return _PARAMLESS_ACTIONS[ActionType.CLOSE_MOUTH]
+    
+    @classmethod
+    def stop_mouth(cls) -> "TuxAction":
+        """Create a stop mouth action."""
+        return _PARAMLESS_ACTIONS[ActionType.STOP_MOUTH]
     
     @classmethod
     def wave_wings(cls, count: int = 1, speed: int = 3) -> "TuxAction":
@@ -136,12 +233,22 @@ class TuxAction:
     @classmethod
     def raise_wings(cls) -> "TuxAction":
         """Create a raise wings action."""
-        return cls(ActionType.RAISE_WINGS, {})
+        return _PARAMLESS_ACTIONS[ActionType.RAISE_WINGS]
     
     @classmethod
     def lower_wings(cls) -> "TuxAction":
         """Create a lower wings action."""
-        return cls(ActionType.LOWER_WINGS, {})
+        return _PARAMLESS_ACTIONS[ActionType.LOWER_WINGS]
+    
+    @classmethod
+    def stop_wings(cls) -> "TuxAction":
+        """Create a stop wings action."""
+        return _PARAMLESS_ACTIONS[ActionType.STOP_WINGS]
+    
+    @classmethod
+    def reset_wings(cls) -> "TuxAction":
+        """Create a reset wings action."""
+        return _PARAMLESS_ACTIONS[ActionType.RESET_WINGS]
     
     @classmethod
     def spin_left(cls, angle: int = 4, speed: int = 3) -> "TuxAction":
@@ -165,6 +272,11 @@ class TuxAction:
         """
         return cls(ActionType.SPIN_RIGHT, {"angle": angle, "speed": speed})
     
+    @classmethod
+    def stop_spin(cls) -> "TuxAction":
+        """Create a stop spin action."""
+        return _PARAMLESS_ACTIONS[ActionType.STOP_SPIN]
+    
     @classmethod
     def led_on(cls, target: LEDTarget = LEDTarget.BOTH) -> "TuxAction":
         """Create an LED on action."""
@@ -218,7 +330,71 @@ class TuxAction:
     @classmethod
     def wake_up(cls) -> "TuxAction":
         """Create a wake up action."""
-        return cls(ActionType.WAKE_UP, {})
+        return _PARAMLESS_ACTIONS[ActionType.WAKE_UP]
+
+
+# Shared instances for actions that never take parameters. Their params
+# mapping is read-only, so they are safe to reuse across calls.
+_NO_PARAMS: Mapping[str, Any] = MappingProxyType({})
+_PARAMLESS_ACTIONS = {
+    action_type: TuxAction(action_type, _NO_PARAMS)
+    for action_type in (
+        ActionType.OPEN_EYES,
+        ActionType.CLOSE_EYES,
+        ActionType.STOP_EYES,
+        ActionType.OPEN_MOUTH,
+        ActionType.CLOSE_MOUTH,
+        ActionType.STOP_MOUTH,
+        ActionType.RAISE_WINGS,
+        ActionType.LOWER_WINGS,
+        ActionType.STOP_WINGS,
+        ActionType.RESET_WINGS,
+        ActionType.STOP_SPIN,
+        ActionType.WAKE_UP,
+    )
+}
+PARAMLESS_ACTION_TYPES = frozenset(_PARAMLESS_ACTIONS)
+
+
+# Actions whose "count" repeats the movement in firmware, so consecutive
+# runs can be merged into one command. Counts travel as a single byte.
+REPEATABLE_ACTIONS = frozenset({
+    ActionType.BLINK_EYES,
+    ActionType.MOVE_MOUTH,
+    ActionType.WAVE_WINGS,
+    ActionType.LED_TOGGLE,
+})
+MAX_REPEAT_COUNT = 255
+
+
+def coalesce_actions(actions: Iterable[TuxAction]) -> List[TuxAction]:
+    """
+    Merge consecutive repeatable actions into single repeat-count actions.
+    
+    Two neighbouring actions are merged when they have the same repeatable
+    type and identical parameters apart from "count" (e.g. blink x2 then
+    blink x3 becomes blink x5). Merged counts never exceed MAX_REPEAT_COUNT.
+    
+    Args:
+        actions: Actions in execution order
+        
+    Returns:
+        list: The coalesced actions, in the same order
+    """
+    result: List[TuxAction] = []
+    for action in actions:
+        if result and action.action_type in REPEATABLE_ACTIONS:
+            previous = result[-1]
+            if previous.action_type == action.action_type:
+                previous_params = dict(previous.params)
+                params = dict(action.params)
+                count = previous_params.pop("count", 1) + params.pop("count", 1)
+                if previous_params == params and count <= MAX_REPEAT_COUNT:
+                    params["count"] = count
+                    result[-1] = TuxAction(action.action_type, params)
+                    continue
+        result.append(action)
+    return result
 
 
 # Firmware command codes (from commands.h)
@@ -259,3 +435,9 @@ FIRMWARE_COMMANDS = {
     ActionType.IR_SEND: 0x91,
 }
 
+# Firmware command codes indexed by ActionType.ordinal. 0x00 is not a
+# firmware command, so it marks actions without one.
+NO_COMMAND = 0x00
+FIRMWARE_COMMAND_TABLE: bytes = bytes(
+    FIRMWARE_COMMANDS.get(action_type, NO_COMMAND) for action_type in ActionType
+)
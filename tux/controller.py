@@ -6,14 +6,60 @@ This module provides a high-level interface for controlling TUX Droid.
 It wraps the driver layer and provides easy-to-use methods.
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Optional, Dict, Any
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
 
-from .actions import TuxAction, ActionType, LEDTarget, SleepMode
+from .actions import (
+    TuxAction, ActionType, LEDTarget, SleepMode, PARAMLESS_ACTION_TYPES, coalesce_actions
+)
 from .driver import TuxDriverInterface, TuxDriver
 
 logger = logging.getLogger(__name__)
 
+# Per-action (action value, success message), built once at import
+_RESULT_TEMPLATES = {
+    action_type: (action_type.value, f"Action '{action_type.value}' executed successfully")
+    for action_type in ActionType
+}
+
+# Actions that never carry params get a ready-made success result, copied
+# per call (with a fresh params dict) so callers can still modify it
+_STATELESS = PARAMLESS_ACTION_TYPES
+_STATELESS_RESULTS = {
+    action_type: {
+        "success": True,
+        "action": _RESULT_TEMPLATES[action_type][0],
+        "params": {},
+        "message": _RESULT_TEMPLATES[action_type][1],
+    }
+    for action_type in _STATELESS
+}
+
+# Value -> enum member lookups; the enum constructor is only used to raise
+# the usual ValueError for unknown values
+_LED_TARGETS = {target.value: target for target in LEDTarget}
+_SLEEP_MODES = {mode.value: mode for mode in SleepMode}
+
+
+def _led_target(target: Any) -> LEDTarget:
+    """Resolve an LED target name; ValueError for anything else."""
+    return (_LED_TARGETS.get(target) if isinstance(target, str) else None) or LEDTarget(target)
+
+
+def _sleep_mode(mode: Any) -> SleepMode:
+    """Resolve a sleep mode name; ValueError for anything else."""
+    return (_SLEEP_MODES.get(mode) if isinstance(mode, str) else None) or SleepMode(mode)
+
+
+# Maximum number of asynchronous actions queued or being written at once
+_ASYNC_MAX_IN_FLIGHT = 3
+
 
 class TuxController:
     """
@@ -40,6 +86,11 @@ class TuxController:
         """
         self.driver = driver
         self._last_action: Optional[TuxAction] = None
+        self._batch: Optional[List[TuxAction]] = None
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.RLock()
+        self._in_flight = threading.BoundedSemaphore(_ASYNC_MAX_IN_FLIGHT)
         logger.info("TuxController initialized")
     
     def connect(self) -> bool:
@@ -52,6 +103,7 @@ class TuxController:
         result = self.driver.connect()
         if result:
             logger.info("TuxController: Connected to TUX Droid")
+            self._start_writer()
         return result
     
     def disconnect(self) -> bool:
@@ -61,11 +113,23 @@ class TuxController:
         Returns:
             bool: True if disconnection successful
         """
+        self._stop_writer()
         result = self.driver.disconnect()
         if result:
             logger.info("TuxController: Disconnected from TUX Droid")
         return result
     
+    def watch_hotplug(self) -> bool:
+        """
+        Connect through this controller whenever the TUX dongle is plugged in.
+        
+        Returns:
+            bool: True if the driver is watching for the dongle
+        """
+        if not isinstance(self.driver, TuxDriver):
+            return False
+        return self.driver.watch_hotplug(connect=self.connect)
+    
     def is_connected(self) -> bool:
         """Check if connected to TUX Droid."""
         return self.driver.is_connected()
@@ -82,23 +146,292 @@ class TuxController:
         """
         self._last_action = action
         
+        if self._batch is not None:
+            self._batch.append(action)
+            value = _RESULT_TEMPLATES[action.action_type][0]
+            return {
+                "success": True,
+                "action": value,
+                "params": action.params,
+                "message": f"Action '{value}' queued"
+            }
+        
+        return self._call_driver(self._send, action)
+    
+    def _call_driver(self, call: Callable[[Any], Dict[str, Any]], arg: Any) -> Dict[str, Any]:
+        """
+        Run a driver call on the writer thread while it is running.
+        
+        The writer owns the driver while connected, so synchronous calls
+        queue behind pending asynchronous actions instead of racing them.
+        """
+        if threading.current_thread() is not self._writer:
+            future: "Future[Dict[str, Any]]" = Future()
+            with self._writer_lock:
+                pending = self._queue
+                if pending is not None:
+                    pending.put((call, arg, future, False))
+            if pending is not None:
+                return future.result()
+        return call(arg)
+    
+    def _send(self, action: TuxAction) -> Dict[str, Any]:
+        """Send a single action to the driver and build its result."""
+        value, success_message = _RESULT_TEMPLATES[action.action_type]
         try:
             success = self.driver.execute_action(action)
+            if success and action.action_type in _STATELESS:
+                return {**_STATELESS_RESULTS[action.action_type], "params": {}}
             return {
                 "success": success,
-                "action": action.action_type.value,
+                "action": value,
                 "params": action.params,
-                "message": f"Action '{action.action_type.value}' executed successfully" if success else "Action failed"
+                "message": success_message if success else "Action failed"
             }
         except Exception as e:
-            logger.error(f"Error executing action: {e}")
+            logger.error("Error executing action: %s", e)
             return {
                 "success": False,
-                "action": action.action_type.value,
+                "action": value,
                 "params": action.params,
                 "message": str(e)
             }
     
+    def execute_async(self, action: TuxAction) -> "Future[Dict[str, Any]]":
+        """
+        Queue an action for the background writer and return immediately.
+        
+        Actions are written in submission order by a single writer thread,
+        so the caller can prepare the next command while the previous one
+        is on the wire. At most three actions are outstanding at a time;
+        further calls block until one completes, so coroutines should
+        await aexecute() instead.
+        
+        Args:
+            action: The action to execute
+            
+        Returns:
+            Future: Resolves to the same result dict _execute() returns
+        """
+        self._in_flight.acquire()
+        return self._submit(action)
+    
+    async def aexecute(self, action: TuxAction) -> Dict[str, Any]:
+        """
+        Execute an action on the background writer from a coroutine.
+        
+        Same ordering and in-flight limit as execute_async(), but waiting
+        for a free slot happens off the event loop.
+        
+        Args:
+            action: The action to execute
+            
+        Returns:
+            dict: Result of the action
+        """
+        if not self._in_flight.acquire(blocking=False):
+            acquired = asyncio.get_running_loop().run_in_executor(None, self._in_flight.acquire)
+            try:
+                await asyncio.shield(acquired)
+            except asyncio.CancelledError:
+                # The slot is still taken once the executor gets it; hand it back
+                acquired.add_done_callback(lambda _: self._in_flight.release())
+                raise
+        return await asyncio.wrap_future(self._submit(action))
+    
+    def _submit(self, action: TuxAction) -> "Future[Dict[str, Any]]":
+        """Queue an action for the writer; the caller holds an in-flight slot."""
+        self._last_action = action
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._writer_lock:
+            pending = self._start_writer()
+            pending.put((self._send, action, future, True))
+        return future
+    
+    def _start_writer(self) -> queue.SimpleQueue:
+        """Start the background writer thread if it is not running."""
+        with self._writer_lock:
+            if self._queue is not None:
+                return self._queue
+            pending: queue.SimpleQueue = queue.SimpleQueue()
+            self._queue = pending
+            self._writer = threading.Thread(
+                target=self._writer_loop, args=(pending,),
+                name="TuxControllerWriter", daemon=True
+            )
+            self._writer.start()
+            return pending
+    
+    def _stop_writer(self):
+        """Finish the queued actions and stop the background writer."""
+        with self._writer_lock:
+            pending, writer = self._queue, self._writer
+            if pending is None or writer is None:
+                return
+            pending.put(None)
+            self._queue = self._writer = None
+        writer.join()
+    
+    def _writer_loop(self, pending: queue.SimpleQueue):
+        """Run queued driver calls in order until the stop marker arrives."""
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            call, arg, future, holds_slot = item
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(call(arg))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                if holds_slot:
+                    self._in_flight.release()
+    
+    def batch_execute(self, actions: List[TuxAction]) -> Dict[str, Any]:
+        """
+        Execute several actions as a single batch.
+        
+        Args:
+            actions: The actions to execute, in order
+            
+        Returns:
+            dict: Result with success status and the executed action types
+        """
+        if actions:
+            self._last_action = actions[-1]
+        return self._call_driver(self._send_batch, actions)
+    
+    def _send_batch(self, actions: List[TuxAction]) -> Dict[str, Any]:
+        """Send a batch to the driver and build its result."""
+        action_values = [action.type_value for action in actions]
+        try:
+            success = self.driver.batch_execute(actions)
+            return {
+                "success": success,
+                "action": "batch",
+                "params": {"actions": action_values},
+                "message": f"Batch of {len(actions)} action(s) executed successfully" if success else "Batch failed"
+            }
+        except Exception as e:
+            logger.error("Error executing batch: %s", e)
+            return {
+                "success": False,
+                "action": "batch",
+                "params": {"actions": action_values},
+                "message": str(e)
+            }
+    
+    def execute_many(self, actions: Iterable[TuxAction]) -> Dict[str, Any]:
+        """
+        Execute a sequence of actions, merging repeated movements.
+        
+        Consecutive repeatable actions of the same type (blink, mouth,
+        wings, LED toggle) are combined into a single repeat-count command
+        before the sequence is sent to the driver as one batch.
+        
+        Args:
+            actions: The actions to execute, in order
+            
+        Returns:
+            dict: Result of the batch
+        """
+        return self.batch_execute(coalesce_actions(actions))
+    
+    def dispatch(self, action_name: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute a controller action by name.
+        
+        Parameters not accepted by the named action are ignored; missing
+        ones fall back to the action's defaults.
+        
+        Args:
+            action_name: Action name (e.g. "blink_eyes", "led_on")
+            params: Keyword parameters for the action
+            
+        Returns:
+            dict: Result of the action
+            
+        Raises:
+            ValueError: If the action name is unknown
+        """
+        entry = _DISPATCH.get(action_name)
+        if entry is None:
+            raise ValueError(
+                f"Unknown action type: {action_name}. Available: {list(_DISPATCH)}"
+            )
+        method, accepted = entry
+        if not params:
+            return method(self)
+        return method(self, **{key: value for key, value in params.items() if key in accepted})
+    
+    def dispatch_many(self, requests: Iterable[Tuple[str, Optional[Dict[str, Any]]]]) -> Dict[str, Any]:
+        """
+        Execute named actions as one batch, merging repeated movements.
+        
+        Every (name, params) pair is validated exactly as dispatch() does
+        before anything is sent, so one bad entry rejects the whole batch.
+        
+        Args:
+            requests: (action name, params) pairs, in order
+            
+        Returns:
+            dict: Result of the batch
+            
+        Raises:
+            ValueError: If an action name or parameter is invalid
+        """
+        self.begin_batch()
+        try:
+            for action_name, params in requests:
+                self.dispatch(action_name, params)
+        except BaseException:
+            self._batch = None
+            raise
+        actions, self._batch = self._batch or [], None
+        return self.execute_many(actions)
+    
+    def begin_batch(self):
+        """
+        Start queueing actions instead of executing them immediately.
+        
+        Queued actions are sent to the driver in one batch by end_batch().
+        """
+        if self._batch is not None:
+            raise RuntimeError("A batch is already in progress")
+        self._batch = []
+    
+    def end_batch(self) -> Dict[str, Any]:
+        """
+        Stop queueing and execute all queued actions as one batch.
+        
+        Returns:
+            dict: Result of the batch
+        """
+        if self._batch is None:
+            raise RuntimeError("No batch in progress")
+        actions, self._batch = self._batch, None
+        return self.batch_execute(actions)
+    
+    @contextmanager
+    def batch(self) -> Iterator["TuxController"]:
+        """
+        Queue all actions issued inside the block and flush them on exit.
+        
+        Example:
+            with controller.batch():
+                controller.blink_eyes(2)
+                controller.wave_wings(3)
+        """
+        self.begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self._batch = None
+            raise
+        self.end_batch()
+    
     # ==========================================
     # Eye Controls
     # ==========================================
@@ -113,7 +446,7 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Blinking eyes {count} time(s)")
+        logger.info("Blinking eyes %s time(s)", count)
         return self._execute(TuxAction.blink_eyes(count))
     
     def open_eyes(self) -> Dict[str, Any]:
@@ -129,7 +462,7 @@ class TuxController:
     def stop_eyes(self) -> Dict[str, Any]:
         """Stop eye movement."""
         logger.info("Stopping eyes")
-        return self._execute(TuxAction(ActionType.STOP_EYES, {}))
+        return self._execute(TuxAction.stop_eyes())
     
     # ==========================================
     # Mouth Controls
@@ -145,7 +478,7 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Moving mouth {count} time(s)")
+        logger.info("Moving mouth %s time(s)", count)
         return self._execute(TuxAction.move_mouth(count))
     
     def open_mouth(self) -> Dict[str, Any]:
@@ -161,7 +494,7 @@ class TuxController:
     def stop_mouth(self) -> Dict[str, Any]:
         """Stop mouth movement."""
         logger.info("Stopping mouth")
-        return self._execute(TuxAction(ActionType.STOP_MOUTH, {}))
+        return self._execute(TuxAction.stop_mouth())
     
     # ==========================================
     # Wing/Flipper Controls
@@ -178,7 +511,7 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Waving wings {count} time(s) at speed {speed}")
+        logger.info("Waving wings %s time(s) at speed %s", count, speed)
         return self._execute(TuxAction.wave_wings(count, speed))
     
     def raise_wings(self) -> Dict[str, Any]:
@@ -194,12 +527,12 @@ class TuxController:
     def stop_wings(self) -> Dict[str, Any]:
         """Stop wing movement."""
         logger.info("Stopping wings")
-        return self._execute(TuxAction(ActionType.STOP_WINGS, {}))
+        return self._execute(TuxAction.stop_wings())
     
     def reset_wings(self) -> Dict[str, Any]:
         """Reset wings to default position."""
         logger.info("Resetting wings")
-        return self._execute(TuxAction(ActionType.RESET_WINGS, {}))
+        return self._execute(TuxAction.reset_wings())
     
     # ==========================================
     # Spin/Rotation Controls
@@ -216,7 +549,7 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Spinning left: angle={angle}, speed={speed}")
+        logger.info("Spinning left: angle=%s, speed=%s", angle, speed)
         return self._execute(TuxAction.spin_left(angle, speed))
     
     def spin_right(self, angle: int = 4, speed: int = 3) -> Dict[str, Any]:
@@ -230,13 +563,13 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Spinning right: angle={angle}, speed={speed}")
+        logger.info("Spinning right: angle=%s, speed=%s", angle, speed)
         return self._execute(TuxAction.spin_right(angle, speed))
     
     def stop_spin(self) -> Dict[str, Any]:
         """Stop spinning."""
         logger.info("Stopping spin")
-        return self._execute(TuxAction(ActionType.STOP_SPIN, {}))
+        return self._execute(TuxAction.stop_spin())
     
     # ==========================================
     # LED Controls
@@ -252,8 +585,8 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Turning on LEDs: {target}")
-        led_target = LEDTarget(target)
+        logger.info("Turning on LEDs: %s", target)
+        led_target = _led_target(target)
         return self._execute(TuxAction.led_on(led_target))
     
     def led_off(self, target: str = "both") -> Dict[str, Any]:
@@ -266,8 +599,8 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Turning off LEDs: {target}")
-        led_target = LEDTarget(target)
+        logger.info("Turning off LEDs: %s", target)
+        led_target = _led_target(target)
         return self._execute(TuxAction.led_off(led_target))
     
     def led_toggle(self, count: int = 1, delay: int = 25) -> Dict[str, Any]:
@@ -281,7 +614,7 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Toggling LEDs {count} time(s)")
+        logger.info("Toggling LEDs %s time(s)", count)
         return self._execute(TuxAction.led_toggle(count, delay))
     
     def led_pulse(self, target: str = "both", count: int = 5, 
@@ -297,8 +630,8 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Pulsing LEDs: target={target}, count={count}")
-        led_target = LEDTarget(target)
+        logger.info("Pulsing LEDs: target=%s, count=%s", target, count)
+        led_target = _led_target(target)
         return self._execute(TuxAction.led_pulse(led_target, count, pulse_width))
     
     # ==========================================
@@ -316,7 +649,7 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Playing sound {sound_number} at volume {volume}")
+        logger.info("Playing sound %s at volume %s", sound_number, volume)
         return self._execute(TuxAction.play_sound(sound_number, volume))
     
     def mute(self) -> Dict[str, Any]:
@@ -343,8 +676,8 @@ class TuxController:
         Returns:
             dict: Result of the action
         """
-        logger.info(f"Putting TUX to sleep: mode={mode}")
-        sleep_mode = SleepMode(mode)
+        logger.info("Putting TUX to sleep: mode=%s", mode)
+        sleep_mode = _sleep_mode(mode)
         return self._execute(TuxAction.sleep(sleep_mode))
     
     def wake_up(self) -> Dict[str, Any]:
@@ -366,6 +699,23 @@ class TuxController:
         driver_status = self.driver.get_status()
         return {
             **driver_status,
-            "last_action": self._last_action.action_type.value if self._last_action else None
+            "last_action": self._last_action.type_value if self._last_action else None
         }
 
+
+# Action name -> (controller method, accepted keyword names), used by dispatch()
+_DISPATCH = {
+    name: (
+        getattr(TuxController, name),
+        frozenset(inspect.signature(getattr(TuxController, name)).parameters) - {"self"},
+    )
+    for name in (
+        "blink_eyes", "open_eyes", "close_eyes", "stop_eyes",
+        "move_mouth", "open_mouth", "close_mouth", "stop_mouth",
+        "wave_wings", "raise_wings", "lower_wings", "stop_wings", "reset_wings",
+        "spin_left", "spin_right", "stop_spin",
+        "led_on", "led_off", "led_toggle", "led_pulse",
+        "play_sound", "mute", "unmute",
+        "sleep", "wake_up",
+    )
+}
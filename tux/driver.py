@@ -23,12 +23,44 @@ USB Structure:
 Commands are 4 bytes each (CMD_SIZE = 4 from firmware).
 """
 
+import asyncio
 import logging
+import queue
+import struct
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any, Dict, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Any, Callable, Deque, Dict, Iterable, Mapping, Tuple
 
-from .actions import TuxAction, ActionType, FIRMWARE_COMMANDS
+from .actions import (
+    TuxAction, ActionType, FIRMWARE_COMMAND_TABLE, NO_COMMAND, REPEATABLE_ACTIONS, coalesce_actions
+)
+
+try:
+    import usb.core
+    import usb.util
+    _HAVE_PYUSB = True
+except ImportError:
+    usb = None
+    _HAVE_PYUSB = False
+
+try:
+    import hid  # type: ignore[import-not-found, import-untyped]
+    _HAVE_HIDAPI = True
+except ImportError:
+    hid = None
+    _HAVE_HIDAPI = False
+
+try:
+    import pyudev  # type: ignore[import-not-found, import-untyped]
+    _HAVE_PYUDEV = True
+except ImportError:
+    pyudev = None
+    _HAVE_PYUDEV = False
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +68,9 @@ logger = logging.getLogger(__name__)
 TUX_VENDOR_ID = 0x03eb   # Atmel/Kysoh
 TUX_PRODUCT_ID = 0xff07  # Tux Droid fish dongle
 
+# Prefix of the udev PRODUCT property ("vid/pid/bcdDevice", lowercase hex)
+_TUX_UDEV_PRODUCT = f"{TUX_VENDOR_ID:x}/{TUX_PRODUCT_ID:x}/"
+
 # USB Interface and Endpoints for commands (HID interface)
 TUX_INTERFACE = 3        # HID interface for commands
 TUX_ENDPOINT_OUT = 0x05  # Interrupt OUT endpoint
@@ -43,6 +78,137 @@ TUX_ENDPOINT_IN = 0x84   # Interrupt IN endpoint
 
 # Command size from firmware (defines.h)
 CMD_SIZE = 4
+_ZERO_FRAME = bytes(CMD_SIZE)
+
+# HID endpoint max packet size, and how many commands fit in one report
+HID_REPORT_SIZE = 64
+_MAX_PACKED_COMMANDS = HID_REPORT_SIZE // CMD_SIZE
+
+# Packs a 4-byte command frame in one C call; TuxAction has already checked
+# that byte params fit
+_PACK4 = struct.Struct("<BBBB").pack
+
+# PING_CMD = 0x7F from commands.h
+_PING_COMMAND = _PACK4(0x7F, 0x01, 0x00, 0x00)
+_PING_HEX = _PING_COMMAND.hex()
+
+# Background reader: poll timeout per IN read, and how many unread
+# reports to keep before dropping the oldest
+_RX_POLL_MS = 100
+_RX_QUEUE_SIZE = 256
+
+# Minimum seconds between bus scans in get_diagnostics() while disconnected
+_DIAG_RESCAN_S = 2.0
+
+# Resolved (device, OUT endpoint, IN endpoint) per (vendor, product), so
+# reconnecting skips bus enumeration and descriptor scans
+_DEVICE_CACHE: Dict[Tuple[int, int], Tuple[Any, Any, Any]] = {}
+
+# Firmware codes for string LED targets and sleep modes
+_LED_TARGET_CODES = MappingProxyType({"both": 0x03, "left": 0x01, "right": 0x02})
+_SLEEP_MODE_CODES = MappingProxyType({"awake": 0, "quick": 1, "normal": 2, "deep": 4})
+
+
+def _build_void(action_type: ActionType, command_code: int,
+                params: Mapping[str, Any]) -> bytes:
+    """Encode a command without parameters."""
+    return _PACK4(command_code, 0x00, 0x00, 0x00)
+
+
+def _build_one_param(action_type: ActionType, command_code: int,
+                     params: Mapping[str, Any]) -> bytes:
+    """Encode a 1-parameter command (count, LED target or state)."""
+    param1 = params.get("count", params.get("target", params.get("state", 1)))
+    if isinstance(param1, str):
+        # Convert string targets (and LEDTarget members) to numeric
+        param1 = _LED_TARGET_CODES.get(param1, 1)
+    return _PACK4(command_code, param1, 0x00, 0x00)
+
+
+def _build_two_params(action_type: ActionType, command_code: int,
+                      params: Mapping[str, Any]) -> bytes:
+    """Encode a 2-parameter command (count/angle, then speed/delay/volume)."""
+    param1 = params.get("count", params.get("angle", 1))
+    param2 = params.get("speed", params.get("delay", params.get("volume", 3)))
+    return _PACK4(command_code, param1, param2, 0x00)
+
+
+def _build_three_params(action_type: ActionType, command_code: int,
+                        params: Mapping[str, Any]) -> bytes:
+    """Encode a 3-parameter command, converting sleep modes."""
+    param1 = params.get("param1", params.get("mode", 0))
+    param2 = params.get("param2", 0)
+    param3 = params.get("param3", 0)
+    
+    # Handle sleep mode conversion
+    if action_type == ActionType.SLEEP:
+        param1 = _SLEEP_MODE_CODES.get(params.get("mode", "normal"), 2)
+    elif action_type == ActionType.WAKE_UP:
+        param1 = 0  # SLEEPTYPE_AWAKE
+    
+    # "mode" is not a validated byte param, so param1 is still masked
+    return _PACK4(command_code, int(param1) & 0xFF, param2, param3)
+
+
+def _build_unsupported(action_type: ActionType, command_code: int,
+                       params: Mapping[str, Any]) -> bytes:
+    """Placeholder for action types with no firmware command."""
+    raise ValueError(f"No firmware command for {action_type.value}")
+
+
+def _builder_for(command_code: int) -> Callable[[ActionType, int, Mapping[str, Any]], bytes]:
+    """
+    Pick the encoder for a command code.
+    
+    Command structure from firmware (api.h):
+    - 0b00xxxxxx (0x00-0x3F) - void functions (0 params)
+    - 0b01xxxxxx (0x40-0x7F) - 1 parameter
+    - 0b10xxxxxx (0x80-0xBF) - 2 parameters
+    - 0b11xxxxxx (0xC0-0xFF) - 3 parameters
+    """
+    if command_code < 0x40:
+        return _build_void
+    elif command_code < 0x80:
+        return _build_one_param
+    elif command_code < 0xC0:
+        return _build_two_params
+    else:
+        return _build_three_params
+
+
+# Encoder per ActionType.ordinal, resolved once from the command codes
+_COMMAND_BUILDERS: Tuple[Callable[[ActionType, int, Mapping[str, Any]], bytes], ...] = tuple(
+    _builder_for(code) if code != NO_COMMAND else _build_unsupported
+    for code in FIRMWARE_COMMAND_TABLE
+)
+
+
+@lru_cache(maxsize=256)
+def _encode_command(action_type: ActionType, command_code: int,
+                    params_key: Tuple[Tuple[str, Any], ...]) -> bytes:
+    """Cached encoder call keyed by action type and params items."""
+    return _COMMAND_BUILDERS[action_type.ordinal](action_type, command_code, dict(params_key))
+
+
+# Complete frames for commands without parameters (codes below 0x40),
+# indexed by ActionType.ordinal; None where params must be encoded
+_PREENCODED_COMMANDS: Tuple[Optional[bytes], ...] = tuple(
+    _PACK4(code, 0x00, 0x00, 0x00) if code != NO_COMMAND and code < 0x40 else None
+    for code in FIRMWARE_COMMAND_TABLE
+)
+
+
+def _safe_get_string(device: Any, index: int) -> Optional[str]:
+    """Read a USB string descriptor, returning None if it cannot be read."""
+    try:
+        return usb.util.get_string(device, index)
+    except (OSError, ValueError, NotImplementedError):
+        return None
+
+
+def _tx_barrier(payload: Any) -> bool:
+    """No-op writer-queue entry; once it runs, every earlier write is done."""
+    return True
 
 
 class TuxDriverInterface(ABC):
@@ -53,6 +219,8 @@ class TuxDriverInterface(ABC):
     these methods.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def connect(self) -> bool:
         """
@@ -118,6 +286,38 @@ class TuxDriverInterface(ABC):
             dict: Status information
         """
         pass
+    
+    def batch_execute(self, actions: Iterable[TuxAction]) -> bool:
+        """
+        Execute a sequence of TUX actions.
+        
+        The default implementation runs each action in turn; drivers can
+        override it with a faster batched path.
+        
+        Args:
+            actions: The TuxActions to execute, in order
+            
+        Returns:
+            bool: True if every action executed successfully
+        """
+        results = [self.execute_action(action) for action in actions]
+        return all(results)
+    
+    async def execute_action_async(self, action: TuxAction) -> bool:
+        """
+        Execute a high-level TUX action without blocking the event loop.
+        
+        The default implementation runs execute_action() in the loop's
+        default executor.
+        
+        Args:
+            action: The TuxAction to execute
+            
+        Returns:
+            bool: True if action executed successfully, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute_action, action)
 
 
 class TuxDriver(TuxDriverInterface):
@@ -132,33 +332,92 @@ class TuxDriver(TuxDriverInterface):
     - Endpoint IN: 0x84 (Interrupt transfer)
     """
     
-    def __init__(self, device_path: str = "/dev/ttyUSB0"):
+    # The configuration banner is logged by the first instance only
+    _banner_logged = False
+    
+    def __init__(self, device_path: str = "/dev/ttyUSB0", inter_command_delay_ms: int = 0,
+                 write_timeout_ms: int = 20, coalesce_window_ms: int = 0,
+                 queued_writes: bool = False, background_reads: bool = False,
+                 pack_commands: bool = False, max_queued_writes: int = 0):
         """
         Initialize the TUX driver.
         
         Args:
             device_path: Legacy parameter (not used for USB HID)
+            inter_command_delay_ms: Optional pause after each command, for
+                callers that need to pace the device (0 = no pause)
+            write_timeout_ms: Timeout for each interrupt OUT write; the
+                endpoint is polled every 1 ms, so a short timeout still
+                leaves plenty of margin and fails fast on unplug
+            coalesce_window_ms: If non-zero, repeatable actions (blink,
+                mouth, wings, LED toggle) are held for this long and merged
+                with identical follow-ups into one repeat-count command
+            queued_writes: If True, send_command() only queues the command
+                and returns True; a single writer thread owns all USB
+                writes. Use send_command_sync() when the result matters.
+            background_reads: If True, a reader thread keeps the IN
+                endpoint armed while connected and buffers every report,
+                so device-initiated events are not missed between reads
+            pack_commands: If True, send_commands() and batches pack up to
+                16 commands into each 64-byte report instead of writing
+                one 4-byte transfer per command
+            max_queued_writes: With queued_writes, the most writes allowed
+                to wait for the writer thread (0 = unbounded). When the
+                queue stays full for write_timeout_ms the send fails
+                instead of adding to an ever-growing backlog
         """
         self.device_path = device_path
+        self._inter_command_delay_s = inter_command_delay_ms / 1000
+        self._write_timeout_ms = write_timeout_ms
         self._connected = False
         self._device = None
         self._endpoint_out = None
         self._endpoint_in = None
+        # Bound OUT endpoint write; None whenever the driver is not connected
+        self._endpoint_out_write: Optional[Callable[..., int]] = None
         self._last_error: Optional[str] = None
         self._commands_sent = 0
         self._commands_failed = 0
         self._kernel_driver_detached = False
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        # Held around every OUT transfer: writes can come from the caller,
+        # the I/O executor, the coalescing timer and writer threads
+        self._write_lock = threading.Lock()
+        # Scratch frame for commands that are not CMD_SIZE long; only
+        # touched while _write_lock is held
+        self._tx_buf = bytearray(CMD_SIZE)
+        self._coalesce_window_s = coalesce_window_ms / 1000
+        self._pending_action: Optional[TuxAction] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        # Bumped for every held action, so a timer that fired late cannot
+        # flush an action held after it
+        self._hold_generation = 0
+        self._pending_lock = threading.Lock()
+        self._queued_writes = queued_writes
+        self._max_queued_writes = max_queued_writes
+        self._tx_queue: Optional[queue.Queue] = None
+        self._tx_thread: Optional[threading.Thread] = None
+        self._background_reads = background_reads
+        self._pack_commands = pack_commands
+        self._rx_queue: Deque[bytes] = deque(maxlen=_RX_QUEUE_SIZE)
+        self._rx_ready = threading.Condition()
+        self._rx_stop = threading.Event()
+        self._rx_thread: Optional[threading.Thread] = None
+        # Last get_diagnostics() device lookup, reused between bus scans
+        self._last_scan_ts = 0.0
+        self._last_scan_device = None
+        self._last_scan_result: Optional[Dict[str, Any]] = None
+        self._hotplug_observer = None
+        self._hotplug_connect: Optional[Callable[[], bool]] = None
         
-        logger.info("=" * 60)
-        logger.info("TuxDriver Initialization (USB HID Mode)")
-        logger.info("=" * 60)
-        logger.info(f"Target device: Kysoh TuxDroid")
-        logger.info(f"Vendor ID:  0x{TUX_VENDOR_ID:04X}")
-        logger.info(f"Product ID: 0x{TUX_PRODUCT_ID:04X}")
-        logger.info(f"Interface:  {TUX_INTERFACE} (HID)")
-        logger.info(f"Endpoint OUT: 0x{TUX_ENDPOINT_OUT:02X}")
-        logger.info(f"Endpoint IN:  0x{TUX_ENDPOINT_IN:02X}")
-        logger.info("=" * 60)
+        if not TuxDriver._banner_logged and logger.isEnabledFor(logging.INFO):
+            TuxDriver._banner_logged = True
+            logger.info(
+                "TuxDriver (USB HID): Kysoh TuxDroid %04x:%04x, interface %d, "
+                "OUT 0x%02X, IN 0x%02X",
+                TUX_VENDOR_ID, TUX_PRODUCT_ID, TUX_INTERFACE,
+                TUX_ENDPOINT_OUT, TUX_ENDPOINT_IN,
+            )
     
     def _find_tux_device(self):
         """
@@ -167,34 +426,23 @@ class TuxDriver(TuxDriverInterface):
         Returns:
             USB device object or None
         """
+        if not _HAVE_PYUSB:
+            logger.error("❌ pyusb not installed. Run: pip install pyusb")
+            return None
+        
         try:
-            import usb.core
-            import usb.util
-            
             logger.info("🔍 Searching for TUX Droid USB device...")
             
             # Find TUX device by vendor/product ID
             device = usb.core.find(idVendor=TUX_VENDOR_ID, idProduct=TUX_PRODUCT_ID)
             
             if device is not None:
-                logger.info(f"✅ Found TUX Droid!")
-                logger.info(f"   Bus: {device.bus}")
-                logger.info(f"   Address: {device.address}")
-                try:
-                    manufacturer = usb.util.get_string(device, device.iManufacturer)
-                    product = usb.util.get_string(device, device.iProduct)
-                    logger.info(f"   Manufacturer: {manufacturer}")
-                    logger.info(f"   Product: {product}")
-                except:
-                    pass
+                logger.info("✅ Found TUX Droid (bus %s, address %s)", device.bus, device.address)
                 return device
             else:
                 logger.warning("❌ TUX Droid device not found!")
                 return None
                 
-        except ImportError:
-            logger.error("❌ pyusb not installed. Run: pip install pyusb")
-            return None
         except Exception as e:
             logger.error(f"❌ Error finding device: {e}")
             return None
@@ -206,20 +454,20 @@ class TuxDriver(TuxDriverInterface):
         Returns:
             bool: True if connection successful, False otherwise
         """
-        logger.info("=" * 60)
-        logger.info("🐧 TUX DROID USB CONNECTION ATTEMPT")
-        logger.info("=" * 60)
+        logger.info("🐧 Connecting to TUX Droid via USB HID...")
         
-        try:
-            import usb.core
-            import usb.util
-        except ImportError:
+        if not _HAVE_PYUSB:
             self._last_error = "pyusb not installed. Run: pip install pyusb"
             logger.error(f"❌ {self._last_error}")
             return False
         
-        # Find device
-        self._device = self._find_tux_device()
+        # Find device, reusing the one resolved by a previous connect
+        cache_key = (TUX_VENDOR_ID, TUX_PRODUCT_ID)
+        cached = _DEVICE_CACHE.get(cache_key)
+        if cached is not None:
+            self._device = cached[0]
+        else:
+            self._device = self._find_tux_device()
         if self._device is None:
             self._last_error = "TUX Droid device not found"
             logger.error(f"❌ {self._last_error}")
@@ -232,65 +480,73 @@ class TuxDriver(TuxDriverInterface):
         
         try:
             # Detach kernel driver from Interface 3 if attached
-            logger.info(f"📝 Preparing Interface {TUX_INTERFACE} (HID)...")
+            logger.debug(f"📝 Preparing Interface {TUX_INTERFACE} (HID)...")
             
             if self._device.is_kernel_driver_active(TUX_INTERFACE):
-                logger.info(f"   Detaching kernel driver from interface {TUX_INTERFACE}...")
+                logger.debug(f"   Detaching kernel driver from interface {TUX_INTERFACE}...")
                 try:
                     self._device.detach_kernel_driver(TUX_INTERFACE)
                     self._kernel_driver_detached = True
-                    logger.info("   ✅ Kernel driver detached")
-                except usb.core.USBError as e:
+                    logger.debug("   ✅ Kernel driver detached")
+                except OSError as e:
                     logger.warning(f"   ⚠️ Could not detach kernel driver: {e}")
             
             # Set configuration (may already be set)
             try:
                 self._device.set_configuration()
-            except usb.core.USBError as e:
+            except OSError as e:
                 logger.debug(f"   Configuration note: {e}")
             
             # Claim Interface 3 (HID)
-            logger.info(f"   Claiming interface {TUX_INTERFACE}...")
+            logger.debug(f"   Claiming interface {TUX_INTERFACE}...")
             usb.util.claim_interface(self._device, TUX_INTERFACE)
-            logger.info(f"   ✅ Interface {TUX_INTERFACE} claimed")
+            logger.debug(f"   ✅ Interface {TUX_INTERFACE} claimed")
             
-            # Get the HID interface
-            cfg = self._device.get_active_configuration()
-            intf = cfg[(TUX_INTERFACE, 0)]  # Interface 3, alternate setting 0
-            
-            # Find endpoints
-            self._endpoint_out = usb.util.find_descriptor(
-                intf,
-                custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_OUT
-            )
-            
-            self._endpoint_in = usb.util.find_descriptor(
-                intf,
-                custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_IN
-            )
+            if cached is not None:
+                _, self._endpoint_out, self._endpoint_in = cached
+            else:
+                # Get the HID interface
+                cfg = self._device.get_active_configuration()
+                intf = cfg[(TUX_INTERFACE, 0)]  # Interface 3, alternate setting 0
+                
+                # Pick the known endpoints in one pass over the interface
+                self._endpoint_out = None
+                self._endpoint_in = None
+                for endpoint in intf:
+                    address = endpoint.bEndpointAddress
+                    if address == TUX_ENDPOINT_OUT:
+                        self._endpoint_out = endpoint
+                    elif address == TUX_ENDPOINT_IN:
+                        self._endpoint_in = endpoint
             
             if self._endpoint_out:
-                logger.info(f"   ✅ OUT endpoint: 0x{self._endpoint_out.bEndpointAddress:02X}")
+                logger.debug(f"   ✅ OUT endpoint: 0x{self._endpoint_out.bEndpointAddress:02X}")
             else:
                 logger.error("   ❌ No OUT endpoint found!")
                 return False
             
             if self._endpoint_in:
-                logger.info(f"   ✅ IN endpoint: 0x{self._endpoint_in.bEndpointAddress:02X}")
+                logger.debug(f"   ✅ IN endpoint: 0x{self._endpoint_in.bEndpointAddress:02X}")
             
+            _DEVICE_CACHE[cache_key] = (self._device, self._endpoint_out, self._endpoint_in)
+            self._endpoint_out_write = self._endpoint_out.write
             self._connected = True
             self._last_error = None
             
-            logger.info("=" * 60)
-            logger.info("✅ SUCCESSFULLY CONNECTED TO TUX DROID!")
-            logger.info("=" * 60)
+            logger.info("✅ Connected to TUX Droid")
             
             # Send initial ping to verify communication
             self._send_ping()
+            self._start_rx_thread()
             
             return True
             
-        except usb.core.USBError as e:
+        except OSError as e:
+            # pyusb raises usb.core.USBError, an OSError subclass
+            _DEVICE_CACHE.pop(cache_key, None)
+            if cached is not None:
+                # The cached handle may belong to an unplugged device
+                return self._retry_uncached(e)
             self._last_error = f"USB error: {e}"
             logger.error(f"❌ {self._last_error}")
             
@@ -305,27 +561,37 @@ class TuxDriver(TuxDriverInterface):
             return False
             
         except Exception as e:
+            _DEVICE_CACHE.pop(cache_key, None)
+            if cached is not None:
+                return self._retry_uncached(e)
             self._last_error = f"Connection failed: {e}"
             logger.error(f"❌ {self._last_error}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("Connection failure details", exc_info=True)
             return False
     
+    def _retry_uncached(self, error: Exception) -> bool:
+        """Connect again with a fresh bus lookup after the cached device failed."""
+        logger.info("🔄 Cached TUX device is no longer usable (%s), searching again...", error)
+        self._device = None
+        self._endpoint_out = None
+        self._endpoint_in = None
+        return self.connect()
+    
     def _send_ping(self) -> bool:
         """Send a ping command to verify connection."""
         try:
-            # PING_CMD = 0x7F from commands.h
-            ping_cmd = bytes([0x7F, 0x01, 0x00, 0x00])
-            logger.info(f"📤 Sending PING command: {ping_cmd.hex()}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📤 Sending PING command: %s", _PING_HEX)
             
-            result = self._usb_write(ping_cmd)
+            result = self._usb_write(_PING_COMMAND)
             if result:
                 logger.info("   ✅ PING sent successfully!")
                 
                 # Try to read response
                 response = self._usb_read(timeout=500)
                 if response:
-                    logger.info(f"📥 PING response: {response.hex() if isinstance(response, bytes) else list(response)}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("📥 PING response: %s", response.hex())
                 else:
                     logger.info("📥 No PING response (may be normal)")
             else:
@@ -347,19 +613,26 @@ class TuxDriver(TuxDriverInterface):
         Returns:
             bool: True if successful
         """
-        if not self._device or not self._endpoint_out:
+        write = self._endpoint_out_write
+        if write is None:
             logger.error("   ❌ Device or endpoint not available")
             return False
         
         try:
-            # Pad to CMD_SIZE
-            padded_data = data.ljust(CMD_SIZE, b'\x00')[:CMD_SIZE]
-            
-            # Write via interrupt endpoint
-            bytes_written = self._endpoint_out.write(padded_data, timeout=1000)
-            logger.debug(f"   Written {bytes_written} bytes to endpoint 0x{self._endpoint_out.bEndpointAddress:02X}")
+            # Write via interrupt endpoint. Encoded frames are already
+            # CMD_SIZE; anything else is padded or truncated in place into
+            # the scratch frame, which the lock keeps to one writer at a time
+            with self._write_lock:
+                if len(data) == CMD_SIZE:
+                    bytes_written = write(data, timeout=self._write_timeout_ms)
+                else:
+                    frame = self._tx_buf
+                    frame[:] = _ZERO_FRAME
+                    frame[:min(len(data), CMD_SIZE)] = data[:CMD_SIZE]
+                    bytes_written = write(frame, timeout=self._write_timeout_ms)
+            logger.debug("   Written %s bytes to endpoint 0x%02X", bytes_written, TUX_ENDPOINT_OUT)
             
-            return bytes_written == len(padded_data)
+            return bytes_written == CMD_SIZE
             
         except Exception as e:
             logger.error(f"   USB write error: {e}")
@@ -369,12 +642,52 @@ class TuxDriver(TuxDriverInterface):
         """
         Read data from TUX via USB Interrupt IN endpoint.
         
+        With background reads enabled this returns the oldest buffered
+        report, waiting up to the timeout for one to arrive.
+        
         Args:
             timeout: Timeout in milliseconds
             
         Returns:
             bytes or None
         """
+        if self._rx_thread is None:
+            return self._read_endpoint(timeout)
+        
+        with self._rx_ready:
+            if not self._rx_queue:
+                self._rx_ready.wait(timeout / 1000)
+            return self._rx_queue.popleft() if self._rx_queue else None
+    
+    def _start_rx_thread(self):
+        """Start the background reader if background reads are enabled."""
+        if not self._background_reads or self._rx_thread is not None:
+            return
+        self._rx_stop.clear()
+        self._rx_thread = threading.Thread(target=self._rx_loop, name="TuxDriverRx", daemon=True)
+        self._rx_thread.start()
+    
+    def _stop_rx_thread(self):
+        """Stop the background reader and drop unread reports."""
+        if self._rx_thread is None:
+            return
+        self._rx_stop.set()
+        self._rx_thread.join()
+        self._rx_thread = None
+        self._rx_queue.clear()
+    
+    def _rx_loop(self):
+        """Keep a read pending on the IN endpoint and buffer every report."""
+        read = self._read_endpoint
+        while not self._rx_stop.is_set():
+            data = read(_RX_POLL_MS)
+            if data:
+                with self._rx_ready:
+                    self._rx_queue.append(data)
+                    self._rx_ready.notify()
+    
+    def _read_endpoint(self, timeout: int) -> Optional[bytes]:
+        """Read one report directly from the IN endpoint."""
         if not self._device or not self._endpoint_in:
             return None
         
@@ -382,39 +695,32 @@ class TuxDriver(TuxDriverInterface):
             data = self._endpoint_in.read(64, timeout=timeout)
             return bytes(data)
         except Exception as e:
-            logger.debug(f"   Read timeout or error: {e}")
+            logger.debug("   Read timeout or error: %s", e)
             return None
     
     def disconnect(self) -> bool:
-        """Disconnect from TUX Droid."""
+        """Disconnect from TUX Droid and stop any hotplug monitoring."""
+        self.stop_hotplug_watch()
+        return self._disconnect()
+    
+    def _disconnect(self) -> bool:
+        """Release the device and reset the connection state."""
         logger.info("🔌 Disconnecting from TUX Droid...")
         
+        # Let pending asynchronous writes finish before releasing the device
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+        self.flush_pending()
+        self._stop_tx_thread()
+        self._stop_rx_thread()
+        
         try:
-            import usb.util
-            
             if self._device:
-                # Release interface
-                try:
-                    usb.util.release_interface(self._device, TUX_INTERFACE)
-                    logger.info(f"   ✅ Interface {TUX_INTERFACE} released")
-                except:
-                    pass
-                
-                # Dispose resources
-                try:
-                    usb.util.dispose_resources(self._device)
-                except:
-                    pass
-                
-                # Reattach kernel driver if we detached it
-                if self._kernel_driver_detached:
-                    try:
-                        self._device.attach_kernel_driver(TUX_INTERFACE)
-                        logger.info("   ✅ Kernel driver reattached")
-                    except:
-                        pass
+                self._release_device()
             
             self._connected = False
+            self._endpoint_out_write = None
             self._device = None
             self._endpoint_out = None
             self._endpoint_in = None
@@ -429,15 +735,116 @@ class TuxDriver(TuxDriverInterface):
             logger.error(f"❌ {self._last_error}")
             return False
     
+    def _release_device(self):
+        """Release the claimed interface and hand it back to the kernel."""
+        # Release interface
+        try:
+            usb.util.release_interface(self._device, TUX_INTERFACE)
+            logger.info(f"   ✅ Interface {TUX_INTERFACE} released")
+        except Exception:
+            pass
+        
+        # Dispose resources
+        try:
+            usb.util.dispose_resources(self._device)
+        except Exception:
+            pass
+        
+        # Reattach kernel driver if we detached it
+        if self._kernel_driver_detached:
+            try:
+                self._device.attach_kernel_driver(TUX_INTERFACE)
+                logger.info("   ✅ Kernel driver reattached")
+            except Exception:
+                pass
+    
+    def watch_hotplug(self, connect: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Connect automatically whenever the TUX dongle is plugged in.
+        
+        A udev monitor thread reacts to the dongle appearing instead of
+        callers retrying connect(); unplugging drops the connection so the
+        next plug-in reconnects. Requires the optional ``pyudev`` package.
+        
+        Args:
+            connect: Called instead of connect() when the dongle appears,
+                so an owning TuxController can redo its own connect steps
+        
+        Returns:
+            bool: True if the monitor is running, False if pyudev is missing
+        """
+        if not _HAVE_PYUDEV:
+            logger.debug("pyudev not installed; hotplug monitoring disabled")
+            return False
+        
+        self._hotplug_connect = connect
+        if self._hotplug_observer is None:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by("usb", device_type="usb_device")
+            observer = pyudev.MonitorObserver(
+                monitor, callback=self._on_hotplug, name="TuxDriverHotplug"
+            )
+            observer.daemon = True
+            observer.start()
+            self._hotplug_observer = observer
+            logger.info("👀 Watching for TUX Droid hotplug events")
+        return True
+    
+    def stop_hotplug_watch(self):
+        """Stop the udev monitor started by watch_hotplug()."""
+        observer = self._hotplug_observer
+        if observer is None:
+            return
+        self._hotplug_observer = None
+        observer.stop()
+    
+    def _on_hotplug(self, device):
+        """udev callback: connect when TUX appears, disconnect when it goes."""
+        if not device.get("PRODUCT", "").startswith(_TUX_UDEV_PRODUCT):
+            return
+        
+        if device.action == "add":
+            if not self._connected:
+                logger.info("🔌 TUX Droid plugged in, connecting...")
+                (self._hotplug_connect or self.connect)()
+        elif device.action == "remove":
+            # The cached handle belongs to the old device instance
+            _DEVICE_CACHE.pop((TUX_VENDOR_ID, TUX_PRODUCT_ID), None)
+            if self._connected:
+                logger.warning("🔌 TUX Droid unplugged")
+                self._disconnect()
+    
     def is_connected(self) -> bool:
         """Check if connected to TUX Droid."""
-        return self._connected and self._device is not None and self._endpoint_out is not None
+        # connect() only sets _connected once the device and OUT endpoint are
+        # in place, and disconnect() clears all three together
+        return self._connected
     
     def send_command(self, command: bytes) -> bool:
         """
         Send raw command bytes to TUX Droid.
         
         Commands are padded to CMD_SIZE (4 bytes) as per firmware protocol.
+        With queued_writes enabled the command is handed to the writer
+        thread and True is returned straight away.
+        
+        Args:
+            command: Raw command bytes to send
+            
+        Returns:
+            bool: True if command sent (or queued) successfully
+        """
+        tx = self._get_tx_queue()
+        if tx is not None:
+            return self._enqueue(tx, (self._send_command_now, command, None), 1) == 1
+        return self._send_command_now(command)
+    
+    def send_command_sync(self, command: bytes) -> bool:
+        """
+        Send raw command bytes and wait for the write to complete.
+        
+        With queued_writes enabled the command still goes through the
+        writer thread, after anything queued before it.
         
         Args:
             command: Raw command bytes to send
@@ -445,24 +852,109 @@ class TuxDriver(TuxDriverInterface):
         Returns:
             bool: True if command sent successfully, False otherwise
         """
-        if not self.is_connected():
+        tx = self._get_tx_queue()
+        if tx is None:
+            return self._send_command_now(command)
+        future: "Future[bool]" = Future()
+        tx.put((self._send_command_now, command, future))
+        return future.result()
+    
+    def drain(self) -> bool:
+        """
+        Wait until every queued or held command has been written.
+        
+        Sends never block on earlier ones; call this where ordering
+        against something outside the driver matters.
+        
+        Returns:
+            bool: False if a held (coalesced) action failed to send
+        """
+        result = self.flush_pending()
+        tx = self._tx_queue
+        if tx is not None:
+            future: "Future[bool]" = Future()
+            tx.put((_tx_barrier, None, future))
+            future.result()
+        return result
+    
+    def read_response(self, timeout_ms: int = 100) -> Optional[bytes]:
+        """
+        Read one status report from TUX.
+        
+        Sending never waits for a reply; call this when a command's
+        response is actually needed.
+        
+        Args:
+            timeout_ms: How long to wait for a report
+        
+        Returns:
+            bytes or None if nothing arrived or not connected
+        """
+        if not self._connected:
+            return None
+        return self._usb_read(timeout=timeout_ms)
+    
+    def _get_tx_queue(self) -> Optional[queue.Queue]:
+        """Return the writer queue, starting the writer thread on first use."""
+        if not self._queued_writes or self._endpoint_out_write is None:
+            return None
+        if self._tx_queue is None:
+            self._tx_queue = queue.Queue(maxsize=self._max_queued_writes)
+            self._tx_thread = threading.Thread(
+                target=self._tx_loop, args=(self._tx_queue,),
+                name="TuxDriverTx", daemon=True
+            )
+            self._tx_thread.start()
+        return self._tx_queue
+    
+    def _enqueue(self, tx: queue.Queue, item: Tuple[Any, ...], count: int) -> int:
+        """Queue a write for the writer thread; returns count, or 0 if full."""
+        try:
+            tx.put(item, timeout=self._write_timeout_ms / 1000)
+        except queue.Full:
+            self._commands_failed += count
+            logger.warning("❌ Write queue full, dropping %d command(s)", count)
+            return 0
+        return count
+    
+    def _stop_tx_thread(self):
+        """Drain the writer queue and stop the writer thread."""
+        if self._tx_queue is None:
+            return
+        self._tx_queue.put(None)
+        self._tx_thread.join()
+        self._tx_queue = None
+        self._tx_thread = None
+    
+    def _tx_loop(self, pending: queue.Queue):
+        """Run queued writes in order until the stop marker arrives."""
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            send, payload, future = item
+            result = send(payload)
+            if future is not None:
+                future.set_result(result)
+    
+    def _send_command_now(self, command: bytes) -> bool:
+        """Write one command on the calling thread and update statistics."""
+        if self._endpoint_out_write is None:
             logger.warning("❌ Cannot send command: Not connected to TUX Droid")
             self._commands_failed += 1
             return False
         
         try:
-            # Ensure command is padded to CMD_SIZE
-            padded_command = command.ljust(CMD_SIZE, b'\x00')[:CMD_SIZE]
-            
-            logger.debug(f"📤 Sending command: {padded_command.hex()}")
-            logger.debug(f"   Raw bytes: {list(padded_command)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📤 Sending command: %s", command.hex())
             
-            result = self._usb_write(padded_command)
+            # _usb_write pads the command to CMD_SIZE
+            result = self._usb_write(command)
             
             if result:
                 self._commands_sent += 1
-                # Small delay to let TUX process
-                time.sleep(0.05)
+                if self._inter_command_delay_s:
+                    time.sleep(self._inter_command_delay_s)
             else:
                 self._commands_failed += 1
             
@@ -474,61 +966,285 @@ class TuxDriver(TuxDriverInterface):
             self._commands_failed += 1
             return False
     
+    def send_commands(self, commands: Iterable[bytes]) -> int:
+        """
+        Send several raw commands in one tight loop.
+        
+        The connection is checked once and the statistics are updated once
+        at the end, rather than per command as with send_command().
+        
+        Args:
+            commands: Raw command bytes to send, in order
+            
+        Returns:
+            int: Number of commands sent (or queued) successfully
+        """
+        if self._endpoint_out_write is None:
+            logger.warning("❌ Cannot send commands: Not connected to TUX Droid")
+            return 0
+        
+        tx = self._get_tx_queue()
+        if tx is not None:
+            commands = list(commands)
+            return self._enqueue(tx, (self._send_commands_now, commands, None), len(commands))
+        return self._send_commands_now(commands)
+    
+    def _send_commands_now(self, commands: Iterable[bytes]) -> int:
+        """Write several commands on the calling thread."""
+        if self._pack_commands:
+            return self._send_packed(commands)
+        
+        sent = failed = 0
+        write = self._usb_write
+        delay = self._inter_command_delay_s
+        for command in commands:
+            if write(command):
+                sent += 1
+                if delay:
+                    time.sleep(delay)
+            else:
+                failed += 1
+        
+        self._commands_sent += sent
+        self._commands_failed += failed
+        return sent
+    
+    def _send_packed(self, commands: Iterable[bytes]) -> int:
+        """Write commands packed back to back into full-size HID reports."""
+        frames = [
+            command if len(command) == CMD_SIZE else command[:CMD_SIZE].ljust(CMD_SIZE, b"\x00")
+            for command in commands
+        ]
+        
+        write = self._endpoint_out_write
+        if write is None:
+            logger.error("   ❌ Device or endpoint not available")
+            return 0
+        
+        sent = failed = 0
+        delay = self._inter_command_delay_s
+        for start in range(0, len(frames), _MAX_PACKED_COMMANDS):
+            chunk = frames[start:start + _MAX_PACKED_COMMANDS]
+            report = b"".join(chunk)
+            try:
+                with self._write_lock:
+                    ok = write(report, timeout=self._write_timeout_ms) == len(report)
+            except Exception as e:
+                logger.error("   USB write error: %s", e)
+                ok = False
+            
+            if ok:
+                sent += len(chunk)
+                if delay:
+                    time.sleep(delay)
+            else:
+                failed += len(chunk)
+        
+        self._commands_sent += sent
+        self._commands_failed += failed
+        return sent
+    
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """
+        Return the executor used for asynchronous USB I/O.
+        
+        A single worker keeps asynchronous writes in submission order;
+        _usb_write's lock keeps them from overlapping writes made on
+        other threads, as pyusb expects.
+        """
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TuxDriverIO")
+        return self._io_executor
+    
+    async def send_command_async(self, command: bytes) -> bool:
+        """
+        Send raw command bytes without blocking the event loop.
+        
+        Args:
+            command: Raw command bytes to send
+            
+        Returns:
+            bool: True if command sent successfully, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_io_executor(), self.send_command, command)
+    
+    async def execute_action_async(self, action: TuxAction) -> bool:
+        """
+        Execute a high-level TUX action without blocking the event loop.
+        
+        Args:
+            action: The TuxAction to execute
+            
+        Returns:
+            bool: True if action executed successfully, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_io_executor(), self.execute_action, action)
+    
     def execute_action(self, action: TuxAction) -> bool:
         """
         Execute a high-level TUX action.
         
         Converts the action to firmware command bytes and sends them.
+        When a coalescing window is configured, repeatable actions may be
+        held briefly and merged with identical follow-ups before sending.
         
         Args:
             action: The TuxAction to execute
             
         Returns:
-            bool: True if action executed successfully, False otherwise
+            bool: True if action executed (or was queued) successfully
         """
-        if not self.is_connected():
+        if not self._connected:
             logger.warning("❌ Cannot execute action: Not connected")
             return False
         
+        if self._coalesce_window_s:
+            return self._execute_coalesced(action)
+        return self._execute_now(action)
+    
+    def _execute_coalesced(self, action: TuxAction) -> bool:
+        """Merge the action into the pending one, or flush and send it."""
+        with self._pending_lock:
+            pending = self._pending_action
+            if pending is not None:
+                merged = coalesce_actions((pending, action))
+                if len(merged) == 1:
+                    self._pending_action = merged[0]
+                    return True
+                self._take_pending()
+                self._execute_now(pending)
+            
+            if action.action_type in REPEATABLE_ACTIONS:
+                self._pending_action = action
+                self._hold_generation += 1
+                self._flush_timer = threading.Timer(
+                    self._coalesce_window_s, self._on_flush_timer, args=(self._hold_generation,)
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+                return True
+            
+            return self._execute_now(action)
+    
+    def _take_pending(self) -> Optional[TuxAction]:
+        """Detach the pending action and cancel its flush timer."""
+        pending, self._pending_action = self._pending_action, None
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        return pending
+    
+    def _on_flush_timer(self, generation: int):
+        """Flush the held action if it is still the one this timer was started for."""
+        with self._pending_lock:
+            if generation != self._hold_generation:
+                return
+            pending = self._take_pending()
+            if pending is not None:
+                self._execute_now(pending)
+    
+    def flush_pending(self) -> bool:
+        """
+        Send the action held for coalescing, if any.
+        
+        Returns:
+            bool: False if a held action failed to send, True otherwise
+        """
+        with self._pending_lock:
+            pending = self._take_pending()
+            if pending is None:
+                return True
+            return self._execute_now(pending)
+    
+    def _execute_now(self, action: TuxAction) -> bool:
+        """Encode and send a single action immediately."""
         try:
-            command_code = FIRMWARE_COMMANDS.get(action.action_type)
-            if command_code is None:
-                logger.error(f"❌ Unknown action type: {action.action_type}")
+            command_code = FIRMWARE_COMMAND_TABLE[action.action_type.ordinal]
+            if command_code == NO_COMMAND:
+                logger.error("❌ Unknown action type: %s", action.action_type)
                 return False
             
             # Build command bytes based on action type and params
             command_bytes = self._build_command(action, command_code)
             
-            logger.info(f"🎯 Executing action: {action.action_type.value}")
-            logger.info(f"   Parameters: {action.params}")
-            logger.info(f"   Command code: 0x{command_code:02X}")
-            logger.info(f"   Command bytes: {command_bytes.hex()}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🎯 Executing action: %s | params=%s | code=0x%02X | bytes=%s",
+                            action.type_value, action.params, command_code, command_bytes.hex())
             
             result = self.send_command(command_bytes)
             
             if result:
-                logger.info(f"✅ Action '{action.action_type.value}' executed successfully")
+                logger.info("✅ Action '%s' executed successfully", action.type_value)
             else:
-                logger.error(f"❌ Action '{action.action_type.value}' failed")
+                logger.error("❌ Action '%s' failed", action.type_value)
             
             return result
             
         except Exception as e:
             self._last_error = f"Execute action failed: {e}"
             logger.error(f"❌ {self._last_error}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("Execute action failure details", exc_info=True)
+            return False
+    
+    def batch_execute(self, actions: Iterable[TuxAction]) -> bool:
+        """
+        Execute a sequence of TUX actions back to back.
+        
+        All actions are encoded first, then the frames are written in one
+        tight loop so consecutive commands land in consecutive USB frames
+        instead of being spaced out by per-action encoding and logging.
+        Actions without a firmware command are skipped and make the batch
+        report failure.
+        
+        Args:
+            actions: The TuxActions to execute, in order
+            
+        Returns:
+            bool: True if every action executed successfully
+        """
+        if not self._connected:
+            logger.warning("❌ Cannot execute batch: Not connected")
+            return False
+        
+        self.flush_pending()
+        
+        success = True
+        frames: List[bytes] = []
+        # Bind the table and bound methods once for the loop
+        command_table = FIRMWARE_COMMAND_TABLE
+        build = self._build_command
+        append = frames.append
+        try:
+            for action in actions:
+                command_code = command_table[action.action_type.ordinal]
+                if command_code == NO_COMMAND:
+                    logger.error("❌ Unknown action type: %s", action.action_type)
+                    success = False
+                    continue
+                append(build(action, command_code))
+        except Exception as e:
+            self._last_error = f"Execute batch failed: {e}"
+            logger.error(f"❌ {self._last_error}")
             return False
+        
+        logger.info("🎯 Executing batch of %d command(s)", len(frames))
+        
+        if self.send_commands(frames) != len(frames):
+            success = False
+        
+        return success
     
     def _build_command(self, action: TuxAction, command_code: int) -> bytes:
         """
         Build raw command bytes from action and command code.
         
-        Command structure from firmware (api.h):
-        - 0b00xxxxxx (0x00-0x3F) - void functions (0 params)
-        - 0b01xxxxxx (0x40-0x7F) - 1 parameter
-        - 0b10xxxxxx (0x80-0xBF) - 2 parameters
-        - 0b11xxxxxx (0xC0-0xFF) - 3 parameters
+        Parameterless commands return their pre-built frame directly.
+        Other encodings are cached per (action type, params), since the same
+        commands recur constantly; unhashable params skip the cache. The
+        TuxAction factories always build params in the same key order, so
+        the items tuple is used as the key as-is rather than sorted.
         
         Args:
             action: The TuxAction to convert
@@ -537,40 +1253,16 @@ class TuxDriver(TuxDriverInterface):
         Returns:
             bytes: Raw command bytes to send (padded to CMD_SIZE)
         """
-        params = action.params
+        frame = _PREENCODED_COMMANDS[action.action_type.ordinal]
+        if frame is not None:
+            return frame
         
-        if command_code < 0x40:
-            # No parameters - command only
-            return bytes([command_code, 0x00, 0x00, 0x00])
-            
-        elif command_code < 0x80:
-            # 1 parameter
-            param1 = params.get("count", params.get("target", params.get("state", 1)))
-            if isinstance(param1, str):
-                # Convert string targets to numeric
-                param1 = {"both": 0x03, "left": 0x01, "right": 0x02}.get(param1, 1)
-            return bytes([command_code, int(param1), 0x00, 0x00])
-            
-        elif command_code < 0xC0:
-            # 2 parameters
-            param1 = params.get("count", params.get("angle", 1))
-            param2 = params.get("speed", params.get("delay", params.get("volume", 3)))
-            return bytes([command_code, int(param1), int(param2), 0x00])
-            
-        else:
-            # 3 parameters
-            param1 = params.get("param1", params.get("mode", 0))
-            param2 = params.get("param2", 0)
-            param3 = params.get("param3", 0)
-            
-            # Handle sleep mode conversion
-            if action.action_type == ActionType.SLEEP:
-                mode_map = {"awake": 0, "quick": 1, "normal": 2, "deep": 4}
-                param1 = mode_map.get(params.get("mode", "normal"), 2)
-            elif action.action_type == ActionType.WAKE_UP:
-                param1 = 0  # SLEEPTYPE_AWAKE
-            
-            return bytes([command_code, int(param1), int(param2), int(param3)])
+        params = action.params
+        try:
+            params_key = tuple(params.items())
+            return _encode_command(action.action_type, command_code, params_key)
+        except TypeError:
+            return _COMMAND_BUILDERS[action.action_type.ordinal](action.action_type, command_code, params)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current TUX Droid status."""
@@ -609,14 +1301,148 @@ class TuxDriver(TuxDriverInterface):
         }
         
         # Check if device is present
-        try:
-            import usb.core
-            device = usb.core.find(idVendor=TUX_VENDOR_ID, idProduct=TUX_PRODUCT_ID)
-            diagnostics["device_found"] = device is not None
-            if device:
-                diagnostics["device_bus"] = device.bus
-                diagnostics["device_address"] = device.address
-        except:
+        if not _HAVE_PYUSB:
             diagnostics["device_found"] = "unknown (pyusb not available)"
+            return diagnostics
         
+        diagnostics.update(self._scan_device())
         return diagnostics
+    
+    def _scan_device(self) -> Dict[str, Any]:
+        """
+        Describe the TUX device for get_diagnostics().
+        
+        While connected the already resolved device is described without
+        enumerating the bus; otherwise the bus is rescanned at most once
+        every _DIAG_RESCAN_S seconds and the last result is reused.
+        """
+        now = time.monotonic()
+        cached = _DEVICE_CACHE.get((TUX_VENDOR_ID, TUX_PRODUCT_ID)) if self._connected else None
+        if cached is not None:
+            device = cached[0]
+            if device is self._last_scan_device and self._last_scan_result is not None:
+                return self._last_scan_result
+        elif (self._last_scan_result is not None
+              and now - self._last_scan_ts < _DIAG_RESCAN_S):
+            return self._last_scan_result
+        
+        info: Dict[str, Any] = {}
+        device = None
+        try:
+            if cached is None:
+                device = usb.core.find(idVendor=TUX_VENDOR_ID, idProduct=TUX_PRODUCT_ID)
+            else:
+                device = cached[0]
+            info["device_found"] = device is not None
+            if device:
+                info["device_bus"] = device.bus
+                info["device_address"] = device.address
+                manufacturer = _safe_get_string(device, device.iManufacturer)
+                product = _safe_get_string(device, device.iProduct)
+                if manufacturer is not None and product is not None:
+                    info["manufacturer"] = manufacturer
+                    info["product"] = product
+        except Exception:
+            # Only the lookup itself failing leaves the device state unknown
+            info.setdefault("device_found", "unknown (pyusb not available)")
+        
+        self._last_scan_ts = now
+        self._last_scan_device = device
+        self._last_scan_result = info
+        return info
+
+
+class HidTuxDriver(TuxDriver):
+    """
+    TUX Droid driver using hidapi instead of pyusb.
+    
+    Writes go straight to the kernel HID driver through the hidapi C
+    library, so there is no kernel driver detach or interface claim and
+    far less Python work per command. Command encoding, batching and
+    statistics are shared with TuxDriver.
+    
+    Requires the ``hidapi`` package (``pip install hidapi``).
+    """
+    
+    # hidapi prefixes every output report with its report ID
+    _REPORT_ID = b"\x00"
+    
+    def connect(self) -> bool:
+        """
+        Open the TUX Droid HID interface via hidapi.
+        
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        logger.info("🐧 Connecting to TUX Droid via hidapi...")
+        
+        if not _HAVE_HIDAPI:
+            self._last_error = "hidapi not installed. Run: pip install hidapi"
+            logger.error(f"❌ {self._last_error}")
+            return False
+        
+        try:
+            path = next(
+                (info["path"] for info in hid.enumerate(TUX_VENDOR_ID, TUX_PRODUCT_ID)
+                 if info.get("interface_number") == TUX_INTERFACE),
+                None
+            )
+            if path is None:
+                self._last_error = "TUX Droid device not found"
+                logger.error(f"❌ {self._last_error}")
+                return False
+            
+            device = hid.device()
+            device.open_path(path)
+            
+            self._device = device
+            self._endpoint_out = device
+            self._endpoint_in = device
+            self._endpoint_out_write = self._hid_write
+            self._connected = True
+            self._last_error = None
+            
+            logger.info("✅ Connected to TUX Droid (hidapi)")
+            
+            # Send initial ping to verify communication
+            self._send_ping()
+            self._start_rx_thread()
+            
+            return True
+            
+        except Exception as e:
+            self._last_error = f"Connection failed: {e}"
+            logger.error(f"❌ {self._last_error}")
+            return False
+    
+    def _hid_write(self, data: bytes, timeout: Optional[int] = None) -> int:
+        """Write one command as an output report; returns command bytes written."""
+        device = self._device
+        if device is None:
+            raise IOError("hidapi device is not open")
+        return device.write(self._REPORT_ID + bytes(data)) - 1
+    
+    def _read_endpoint(self, timeout: int) -> Optional[bytes]:
+        """Read one input report through hidapi."""
+        if not self._device:
+            return None
+        
+        try:
+            data = self._device.read(64, timeout)
+            return bytes(data) if data else None
+        except Exception as e:
+            logger.debug("   Read timeout or error: %s", e)
+            return None
+    
+    def _release_device(self):
+        """Close the hidapi handle."""
+        try:
+            self._device.close()
+        except Exception:
+            pass
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get current TUX Droid status."""
+        status = super().get_status()
+        status["driver_type"] = "hardware_hidapi"
+        return status